@@ -4,6 +4,8 @@ Implementação otimizada de CRC-64/ISO e CRC-32/ISO-3309 usando tabelas de look
 
 Este módulo fornece funções para calcular checksums CRC de 32 e 64 bits,
 incluindo suporte para processamento incremental de arquivos grandes.
+Todas as funções aceitam qualquer objeto bytes-like (buffer protocol) sem
+copiá-lo: bytes, bytearray, memoryview, mmap, arrays NumPy contíguos etc.
 
 Created on Sun Sep  7 02:54:53 2025
 @author: uendelrocha@gmail.com
@@ -11,6 +13,13 @@ Created on Sun Sep  7 02:54:53 2025
 Algoritmos implementados:
     - CRC-64/ISO (polinômio 0x42f0e1eba9ea3693)
     - CRC-32/ISO-3309 (polinômio 0xEDB88320)
+    - Qualquer CRC de 8 a 64 bits no modelo Rocksoft (CrcModel), com um
+      catálogo de presets: CRC-32C, CRC-64/XZ, CRC-64/ECMA-182... (crc_model)
+
+Engines de cálculo (mesmo resultado, velocidades diferentes):
+    - ENGINE_BYTEWISE: 1 byte por iteração com uma tabela de 256 valores
+    - ENGINE_SLICE8:   8 bytes por iteração com 8 tabelas (slicing-by-8)
+    - ENGINE_SLICE16:  16 bytes por iteração com 16 tabelas (slicing-by-16)
 
 Example:
     >>> from my.mycrc import crc64, crc32, crc64_hex
@@ -22,6 +31,14 @@ Example:
     2286445522
 """
 
+import asyncio
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from hashlib import md5
+from struct import iter_unpack
+
 # =============================================================================
 # CONSTANTES
 # =============================================================================
@@ -38,10 +55,43 @@ _CRC32_MASK = 0xFFFFFFFF           # 32 bits todos em 1
 CRC64_INIT = _CRC64_MASK  # Valor inicial para CRC-64 incremental
 CRC32_INIT = _CRC32_MASK  # Valor inicial para CRC-32 incremental
 
+# Engines de cálculo disponíveis (selecionáveis por chamada)
+ENGINE_BYTEWISE = 'bytewise'  # 1 byte por iteração, 1 tabela
+ENGINE_SLICE8 = 'slice8'      # 8 bytes por iteração, 8 tabelas
+ENGINE_SLICE16 = 'slice16'    # 16 bytes por iteração, 16 tabelas
+DEFAULT_ENGINE = ENGINE_SLICE16
+
 # Tabelas pré-computadas (lazy initialization)
 _CRC64_TABLE = None
 _CRC32_TABLE = None
 
+# Tabelas de slicing (lazy initialization). O índice 0 é a tabela simples.
+_CRC64_TABLES = None
+_CRC32_TABLES = None
+
+# Tamanho mínimo de cada faixa do arquivo no modo paralelo (workers > 1)
+_PARALLEL_MIN_RANGE = 16 * 1024 * 1024  # 16MB
+
+# Operadores GF(2) de deslocamento por 2^k bytes nulos, por polinômio (lazy)
+_CRC_ZEROS_OPERATORS = {}
+
+# Tabelas simples como arrays NumPy, por polinômio (lazy, usadas em lote)
+_CRC_NUMPY_TABLES = {}
+
+# Chunking definido pelo conteúdo (CDC): tamanhos padrão dos chunks
+CDC_MIN_SIZE = 2 * 1024    # 2KB
+CDC_AVG_SIZE = 8 * 1024    # 8KB
+CDC_MAX_SIZE = 64 * 1024   # 64KB
+_CDC_READ_SIZE = 1024 * 1024  # 1MB por leitura do stream
+
+# Tabela do gear hash (256 valores pseudoaleatórios fixos de 64 bits, lazy)
+_GEAR_TABLE = None
+
+# API assíncrona: buffer de leitura, concorrência e executor padrão (lazy)
+ASYNC_CHUNK_SIZE = 1024 * 1024  # 1MB (arredondado para múltiplo de página)
+ASYNC_CONCURRENCY = 8
+_ASYNC_EXECUTOR = None
+
 
 # =============================================================================
 # FUNÇÕES INTERNAS
@@ -76,6 +126,39 @@ def _calculate_crc_table(crc_poly):
     return table
 
 
+def _as_byte_view(data):
+    """
+    Retorna um memoryview de bytes (formato 'B') sobre data, sem cópia.
+    
+    Aceita qualquer objeto que implemente o buffer protocol: bytes,
+    bytearray, memoryview, mmap, array.array, arrays NumPy contíguos etc.
+    
+    Args:
+        data: Objeto bytes-like
+    
+    Returns:
+        memoryview: Visão unidimensional de bytes sobre o mesmo buffer
+    
+    Raises:
+        TypeError: Se data não suportar o buffer protocol ou não for contíguo
+    """
+    try:
+        view = memoryview(data)
+    except TypeError:
+        raise TypeError(
+            f"Esperado objeto bytes-like (bytes, bytearray, memoryview...), "
+            f"recebido '{type(data).__name__}'"
+        ) from None
+    
+    if not view.c_contiguous:
+        raise TypeError("O buffer de dados deve ser contíguo (C-contiguous)")
+    
+    if view.format != 'B' or view.ndim != 1:
+        view = view.cast('B')
+    
+    return view
+
+
 def _crc(data: bytes, crc_poly, crc_init, crc_xor_out, crc_table):
     """
     Função genérica para calcular o CRC.
@@ -83,7 +166,7 @@ def _crc(data: bytes, crc_poly, crc_init, crc_xor_out, crc_table):
     Esta função implementa o algoritmo core usado por todas as variantes de CRC.
     
     Args:
-        data (bytes): Dados de entrada
+        data (bytes-like): Dados de entrada (qualquer objeto com buffer protocol)
         crc_poly (int): Polinômio CRC
         crc_init (int): Valor inicial do CRC
         crc_xor_out (int): Valor para XOR final (0 para cálculo incremental)
@@ -93,38 +176,504 @@ def _crc(data: bytes, crc_poly, crc_init, crc_xor_out, crc_table):
         int: Valor CRC calculado
     
     Raises:
-        TypeError: Se data não for do tipo bytes
+        TypeError: Se data não suportar o buffer protocol
     """
-    if not isinstance(data, bytes):
-        raise TypeError(f"Esperado 'bytes', recebido '{type(data).__name__}'")
+    view = _as_byte_view(data)
     
     if crc_table is None:
         crc_table = _calculate_crc_table(crc_poly)
     
     crc = crc_init
-    for byte in data:
+    for byte in view:
         table_index = (crc ^ byte) & 0xFF
         crc = (crc >> 8) ^ crc_table[table_index]
     
     return crc ^ crc_xor_out
 
 
+def _calculate_crc_slice_tables(crc_table, n_tables=16):
+    """
+    Calcula as tabelas adicionais usadas pelos engines slicing-by-8/16.
+    
+    A tabela k contém o CRC de um byte seguido de k bytes nulos, o que
+    permite combinar k+1 bytes com k+1 lookups independentes.
+    
+    Args:
+        crc_table (list): Tabela simples de 256 valores (_calculate_crc_table)
+        n_tables (int): Quantidade total de tabelas (padrão: 16)
+    
+    Returns:
+        list: Lista com n_tables tabelas de 256 valores (índice 0 = crc_table)
+    
+    Note:
+        Assim como _calculate_crc_table, é chamada apenas uma vez por
+        polinômio e o resultado é armazenado em cache.
+    """
+    tables = [crc_table]
+    for _ in range(1, n_tables):
+        previous = tables[-1]
+        tables.append([(crc >> 8) ^ crc_table[crc & 0xFF] for crc in previous])
+    return tables
+
+
+def _crc64_tables():
+    """Retorna (e inicializa sob demanda) as 16 tabelas do CRC-64."""
+    global _CRC64_TABLE, _CRC64_TABLES
+    if _CRC64_TABLES is None:
+        if _CRC64_TABLE is None:
+            _CRC64_TABLE = _calculate_crc_table(_CRC64_POLY)
+        _CRC64_TABLES = _calculate_crc_slice_tables(_CRC64_TABLE)
+    return _CRC64_TABLES
+
+
+def _crc32_tables():
+    """Retorna (e inicializa sob demanda) as 16 tabelas do CRC-32."""
+    global _CRC32_TABLE, _CRC32_TABLES
+    if _CRC32_TABLES is None:
+        if _CRC32_TABLE is None:
+            _CRC32_TABLE = _calculate_crc_table(_CRC32_POLY)
+        _CRC32_TABLES = _calculate_crc_slice_tables(_CRC32_TABLE)
+    return _CRC32_TABLES
+
+
+def _crc_slice8(data, crc, crc_tables):
+    """
+    Processa data com slicing-by-8 (8 bytes por iteração).
+    
+    Cada bloco de 8 bytes é lido como um inteiro little-endian e combinado
+    com o CRC corrente; o novo CRC é o XOR de 8 lookups independentes.
+    Os bytes restantes (< 8) são processados byte a byte.
+    
+    Args:
+        data (memoryview): Dados de entrada (visão de bytes)
+        crc (int): Valor CRC corrente (sem XOR final)
+        crc_tables (list): Tabelas de slicing (ao menos 8)
+    
+    Returns:
+        int: Valor CRC atualizado (sem XOR final)
+    """
+    t0, t1, t2, t3, t4, t5, t6, t7 = crc_tables[:8]
+    view = data
+    blocks = len(view) & ~7
+    
+    for (word,) in iter_unpack('<Q', view[:blocks]):
+        crc ^= word
+        crc = (t7[crc & 0xFF] ^ t6[(crc >> 8) & 0xFF] ^
+               t5[(crc >> 16) & 0xFF] ^ t4[(crc >> 24) & 0xFF] ^
+               t3[(crc >> 32) & 0xFF] ^ t2[(crc >> 40) & 0xFF] ^
+               t1[(crc >> 48) & 0xFF] ^ t0[crc >> 56])
+    
+    for byte in view[blocks:]:
+        crc = (crc >> 8) ^ t0[(crc ^ byte) & 0xFF]
+    
+    return crc
+
+
+def _crc_slice16(data, crc, crc_tables):
+    """
+    Processa data com slicing-by-16 (16 bytes por iteração).
+    
+    Variante de _crc_slice8 que consome dois inteiros de 64 bits por
+    iteração. Apenas a primeira palavra é combinada com o CRC corrente;
+    a segunda é indexada diretamente nas tabelas de ordem mais baixa.
+    
+    Args:
+        data (memoryview): Dados de entrada (visão de bytes)
+        crc (int): Valor CRC corrente (sem XOR final)
+        crc_tables (list): Tabelas de slicing (16)
+    
+    Returns:
+        int: Valor CRC atualizado (sem XOR final)
+    """
+    (t0, t1, t2, t3, t4, t5, t6, t7,
+     t8, t9, t10, t11, t12, t13, t14, t15) = crc_tables[:16]
+    view = data
+    blocks = len(view) & ~15
+    
+    for lo, hi in iter_unpack('<QQ', view[:blocks]):
+        lo ^= crc
+        crc = (t15[lo & 0xFF] ^ t14[(lo >> 8) & 0xFF] ^
+               t13[(lo >> 16) & 0xFF] ^ t12[(lo >> 24) & 0xFF] ^
+               t11[(lo >> 32) & 0xFF] ^ t10[(lo >> 40) & 0xFF] ^
+               t9[(lo >> 48) & 0xFF] ^ t8[lo >> 56] ^
+               t7[hi & 0xFF] ^ t6[(hi >> 8) & 0xFF] ^
+               t5[(hi >> 16) & 0xFF] ^ t4[(hi >> 24) & 0xFF] ^
+               t3[(hi >> 32) & 0xFF] ^ t2[(hi >> 40) & 0xFF] ^
+               t1[(hi >> 48) & 0xFF] ^ t0[hi >> 56])
+    
+    for byte in view[blocks:]:
+        crc = (crc >> 8) ^ t0[(crc ^ byte) & 0xFF]
+    
+    return crc
+
+
+def _check_file_args(chunk_size, engine, workers):
+    """
+    Valida os parâmetros das funções de arquivo antes de abrir o arquivo
+    ou criar processos.
+    
+    Raises:
+        ValueError: Se chunk_size ou workers forem menores que 1 ou se o
+            engine não for reconhecido
+    """
+    if engine not in (ENGINE_BYTEWISE, ENGINE_SLICE8, ENGINE_SLICE16):
+        raise ValueError(
+            f"Engine desconhecido: '{engine}'. Use '{ENGINE_BYTEWISE}', "
+            f"'{ENGINE_SLICE8}' ou '{ENGINE_SLICE16}'"
+        )
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size deve ser >= 1, recebido {chunk_size}")
+    if workers < 1:
+        raise ValueError(f"workers deve ser >= 1, recebido {workers}")
+
+
+def _crc_engine(data, crc_init, crc_xor_out, crc_tables, engine):
+    """
+    Calcula o CRC com o engine escolhido.
+    
+    Todos os engines produzem resultados idênticos; mudam apenas a
+    quantidade de bytes processada por iteração.
+    
+    Args:
+        data (bytes-like): Dados de entrada (qualquer objeto com buffer protocol)
+        crc_init (int): Valor inicial do CRC
+        crc_xor_out (int): Valor para XOR final (0 para cálculo incremental)
+        crc_tables (list): Tabelas de slicing (_crc64_tables/_crc32_tables)
+        engine (str): ENGINE_BYTEWISE, ENGINE_SLICE8 ou ENGINE_SLICE16
+    
+    Returns:
+        int: Valor CRC calculado
+    
+    Raises:
+        TypeError: Se data não suportar o buffer protocol
+        ValueError: Se engine não for reconhecido
+    """
+    view = _as_byte_view(data)
+    
+    if engine == ENGINE_SLICE16:
+        crc = _crc_slice16(view, crc_init, crc_tables)
+    elif engine == ENGINE_SLICE8:
+        crc = _crc_slice8(view, crc_init, crc_tables)
+    elif engine == ENGINE_BYTEWISE:
+        crc = _crc(view, None, crc_init, 0, crc_tables[0])
+    else:
+        raise ValueError(
+            f"Engine desconhecido: '{engine}'. Use '{ENGINE_BYTEWISE}', "
+            f"'{ENGINE_SLICE8}' ou '{ENGINE_SLICE16}'"
+        )
+    
+    return crc ^ crc_xor_out
+
+
+def _crc_many(items, offsets, crc_table, crc_poly, crc_mask, dtype_name):
+    """
+    Calcula o CRC de muitos registros curtos em lote com NumPy.
+    
+    Os registros são ordenados por tamanho (decrescente) e processados em
+    passo único: na iteração j, os m registros com mais de j bytes formam
+    um prefixo contíguo e recebem o j-ésimo byte com operações vetoriais.
+    O número de iterações é o tamanho do maior registro, não a quantidade
+    de registros.
+    
+    Args:
+        items: Sequência de objetos bytes-like ou, se offsets for informado,
+            buffer único com os bytes de todos os registros concatenados
+        offsets: None ou array de n+1 posições (layout offsets+data do Arrow)
+        crc_table (list): Tabela simples de 256 valores
+        crc_poly (int): Polinômio CRC (chave do cache de tabelas NumPy)
+        crc_mask (int): Valor inicial e XOR final do CRC
+        dtype_name (str): 'uint64' ou 'uint32'
+    
+    Returns:
+        numpy.ndarray: CRC de cada registro, na ordem de entrada
+    
+    Raises:
+        TypeError: Se algum registro não for bytes-like
+        ValueError: Se offsets não for crescente ou exceder o buffer
+    """
+    import numpy as np  # Dependência opcional: pip install numpy
+    
+    dtype = np.dtype(dtype_name)
+    table = _CRC_NUMPY_TABLES.get(crc_poly)
+    if table is None:
+        table = _CRC_NUMPY_TABLES[crc_poly] = np.array(crc_table, dtype=dtype)
+    
+    if offsets is None:
+        if not hasattr(items, '__len__'):
+            items = list(items)  # Geradores: percorridos duas vezes abaixo
+        try:
+            data = np.frombuffer(b''.join(items), dtype=np.uint8)
+            lengths = np.fromiter(map(len, items), dtype=np.int64)
+        except TypeError:
+            raise TypeError("Esperada uma sequência de objetos bytes-like") from None
+        starts = np.zeros(len(lengths), dtype=np.int64)
+        np.cumsum(lengths[:-1], out=starts[1:])
+    else:
+        data = np.frombuffer(_as_byte_view(items), dtype=np.uint8)
+        offsets = np.asarray(offsets, dtype=np.int64)
+        starts = offsets[:-1]
+        lengths = np.diff(offsets)
+        if len(offsets) and (lengths.min(initial=0) < 0 or offsets[-1] > len(data)):
+            raise ValueError("offsets deve ser crescente e caber no buffer de dados")
+    
+    n = len(lengths)
+    if n == 0:
+        return np.empty(0, dtype=dtype)
+    
+    # Ordena por tamanho decrescente: os registros ativos formam um prefixo
+    order = np.argsort(-lengths, kind='stable')
+    starts = starts[order]
+    lengths = lengths[order]
+    # active[j] = quantidade de registros com mais de j bytes
+    active = n - np.searchsorted(lengths[::-1], np.arange(lengths[0]), side='right')
+    
+    crc = np.full(n, crc_mask, dtype=dtype)
+    shift = dtype.type(8)
+    for j, m in enumerate(active.tolist()):
+        current = crc[:m]
+        index = (current ^ data[starts[:m] + j]) & 0xFF
+        crc[:m] = (current >> shift) ^ table[index]
+    
+    result = np.empty(n, dtype=dtype)
+    result[order] = crc ^ dtype.type(crc_mask)
+    return result
+
+
+def _gf2_matrix_times(matrix, vector):
+    """
+    Multiplica uma matriz GF(2) por um vetor.
+    
+    A matriz é representada como lista de colunas (inteiros) e o vetor
+    como inteiro: o resultado é o XOR das colunas cujos bits estão ativos.
+    """
+    total = 0
+    i = 0
+    while vector:
+        if vector & 1:
+            total ^= matrix[i]
+        vector >>= 1
+        i += 1
+    return total
+
+
+def _gf2_matrix_square(matrix):
+    """Retorna o quadrado de uma matriz GF(2) (matrix x matrix)."""
+    return [_gf2_matrix_times(matrix, column) for column in matrix]
+
+
+def _crc_zeros_operators(crc_poly, width, n_operators):
+    """
+    Retorna os operadores que avançam um CRC por 2^k bytes nulos.
+    
+    O operador de 1 bit nulo é montado a partir do polinômio refletido;
+    elevando-o ao quadrado 3 vezes obtém-se o operador de 1 byte, e cada
+    quadrado seguinte dobra a quantidade de bytes. Os operadores são
+    armazenados em cache por polinômio e estendidos sob demanda.
+    
+    Args:
+        crc_poly (int): Polinômio CRC (refletido)
+        width (int): Largura do CRC em bits (32 ou 64)
+        n_operators (int): Quantidade mínima de operadores (k = 0..n-1)
+    
+    Returns:
+        list: Operadores; o índice k avança 2^k bytes nulos
+    """
+    operators = _CRC_ZEROS_OPERATORS.get(crc_poly)
+    if operators is None:
+        operator = [crc_poly] + [1 << n for n in range(width - 1)]  # 1 bit
+        for _ in range(3):                                          # 8 bits
+            operator = _gf2_matrix_square(operator)
+        operators = _CRC_ZEROS_OPERATORS[crc_poly] = [operator]
+    
+    while len(operators) < n_operators:
+        operators.append(_gf2_matrix_square(operators[-1]))
+    
+    return operators
+
+
+def _crc_shift(crc, length, crc_poly, width):
+    """
+    Avança o registrador CRC como se length bytes nulos fossem processados.
+    
+    O custo é O(log(length)) multiplicações matriz-vetor em GF(2).
+    
+    Args:
+        crc (int): Valor CRC (registrador)
+        length (int): Quantidade de bytes nulos
+        crc_poly (int): Polinômio CRC (refletido)
+        width (int): Largura do CRC em bits (32 ou 64)
+    
+    Returns:
+        int: Registrador CRC deslocado
+    """
+    if length <= 0:
+        return crc
+    
+    operators = _crc_zeros_operators(crc_poly, width, length.bit_length())
+    k = 0
+    while length:
+        if length & 1:
+            crc = _gf2_matrix_times(operators[k], crc)
+        length >>= 1
+        k += 1
+    return crc
+
+
+def _crc_combine(crc_a, crc_b, len_b, crc_poly, width):
+    """
+    Combina os CRCs de dois blocos adjacentes A e B em CRC(A + B).
+    
+    Como init e XOR final são iguais (todos os bits em 1), basta deslocar
+    crc_a por len_b bytes nulos e aplicar XOR com crc_b (mesmo método do
+    crc32_combine da zlib).
+    
+    Raises:
+        ValueError: Se len_b for negativo
+    """
+    if len_b < 0:
+        raise ValueError(f"len_b deve ser >= 0, recebido {len_b}")
+    
+    return _crc_shift(crc_a, len_b, crc_poly, width) ^ crc_b
+
+
+def _crc_file_sequential(filepath, incremental, crc_init, chunk_size, engine):
+    """
+    Calcula o CRC (com XOR final) de um arquivo lendo-o sequencialmente.
+    
+    Usa f.readinto() sobre um único buffer pré-alocado de chunk_size bytes,
+    evitando alocar um novo objeto bytes a cada leitura.
+    
+    Args:
+        filepath (str): Caminho do arquivo
+        incremental (callable): crc64_incremental ou crc32_incremental
+        crc_init (int): Valor inicial do registrador CRC
+        chunk_size (int): Tamanho do buffer de leitura
+        engine (str): Engine de cálculo
+    
+    Returns:
+        int: Registrador final XOR crc_init (para CRC-64/CRC-32, que usam
+            init igual ao XOR final, é o próprio CRC do arquivo)
+    """
+    crc = crc_init
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(filepath, 'rb', buffering=0) as f:
+        while n := f.readinto(buffer):
+            crc = incremental(view[:n], crc, engine)
+    return crc ^ crc_init
+
+
+def _crc_file_range(filepath, offset, length, incremental, crc_init,
+                    chunk_size, engine):
+    """
+    Calcula o CRC (com XOR final) de uma faixa de um arquivo via mmap.
+    
+    Executada em cada processo do modo paralelo; por isso recebe apenas
+    argumentos serializáveis e abre seu próprio mapeamento do arquivo.
+    
+    Args:
+        filepath (str): Caminho do arquivo
+        offset (int): Posição inicial da faixa
+        length (int): Tamanho da faixa em bytes
+        incremental (callable): crc64_incremental ou crc32_incremental
+        crc_init (int): Valor inicial do registrador CRC
+        chunk_size (int): Tamanho de cada bloco processado
+        engine (str): Engine de cálculo
+    
+    Returns:
+        int: Registrador final XOR crc_init, como se a faixa fosse um
+            arquivo independente
+    """
+    crc = crc_init
+    end = offset + length
+    error = None
+    with open(filepath, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Visões sem cópia sobre o mapeamento; liberadas antes do close
+            with memoryview(mm) as view:
+                try:
+                    for pos in range(offset, end, chunk_size):
+                        with view[pos:min(pos + chunk_size, end)] as chunk:
+                            crc = incremental(chunk, crc, engine)
+                except Exception as e:
+                    # O traceback mantém vivas visões derivadas do mmap (nos
+                    # frames de _crc_engine) e faria o close() levantar
+                    # BufferError no lugar do erro original
+                    error = e.with_traceback(None)
+    if error is not None:
+        raise error
+    return crc ^ crc_init
+
+
+def _crc_file_parallel(filepath, incremental, crc_init, combine,
+                       chunk_size, engine, workers):
+    """
+    Calcula o CRC de um arquivo dividindo-o em faixas processadas em paralelo.
+    
+    Cada faixa tem seu CRC calculado em um processo do pool e os resultados
+    são unidos em ordem com a função combine (crc64_combine/crc32_combine),
+    produzindo exatamente o mesmo valor do cálculo sequencial.
+    
+    Args:
+        filepath (str): Caminho do arquivo
+        incremental (callable): crc64_incremental ou crc32_incremental
+        crc_init (int): Valor inicial do registrador CRC
+        combine (callable): crc64_combine ou crc32_combine (deslocamento
+            por bytes nulos seguido de XOR)
+        chunk_size (int): Tamanho de cada bloco processado
+        engine (str): Engine de cálculo
+        workers (int): Quantidade de processos
+    
+    Returns:
+        int: Registrador final XOR crc_init do arquivo completo
+    """
+    size = os.path.getsize(filepath)
+    
+    # Arquivos pequenos não compensam o custo de criar processos
+    if size < 2 * _PARALLEL_MIN_RANGE:
+        if size == 0:
+            return 0  # CRC de 0 bytes (init ^ xor_out)
+        return _crc_file_sequential(filepath, incremental, crc_init,
+                                    chunk_size, engine)
+    
+    # Cerca de 4 faixas por processo para equilibrar a carga
+    range_size = max(-(-size // (workers * 4)), _PARALLEL_MIN_RANGE)
+    offsets = range(0, size, range_size)
+    lengths = [min(range_size, size - offset) for offset in offsets]
+    n = len(lengths)
+    
+    with ProcessPoolExecutor(max_workers=min(workers, n)) as executor:
+        crcs = executor.map(_crc_file_range, [filepath] * n, offsets, lengths,
+                            [incremental] * n, [crc_init] * n,
+                            [chunk_size] * n, [engine] * n)
+        
+        crc = None
+        for range_crc, length in zip(crcs, lengths):
+            crc = range_crc if crc is None else combine(crc, range_crc, length)
+    
+    return crc
+
+
 # =============================================================================
 # CRC-64 - FUNÇÕES PRINCIPAIS
 # =============================================================================
 
-def crc64(data: bytes) -> int:
+def crc64(data: bytes, engine: str = DEFAULT_ENGINE) -> int:
     """
     Calcula o valor CRC-64/ISO para os dados de entrada.
     
     Args:
-        data (bytes): Os dados de entrada para o cálculo do CRC
+        data (bytes-like): Os dados de entrada para o cálculo do CRC
+            (bytes, bytearray, memoryview, mmap, array NumPy contíguo...)
+        engine (str): Engine de cálculo: ENGINE_BYTEWISE, ENGINE_SLICE8 ou
+            ENGINE_SLICE16 (padrão: DEFAULT_ENGINE)
     
     Returns:
         int: O valor CRC-64 calculado (inteiro positivo de 64 bits)
     
     Raises:
-        TypeError: Se data não for bytes
+        TypeError: Se data não suportar o buffer protocol
+        ValueError: Se engine não for reconhecido
     
     Example:
         >>> crc64(b"123456")
@@ -136,14 +685,11 @@ def crc64(data: bytes) -> int:
         Este hash NÃO deve ser usado para armazenar senhas.
         Colisões conhecidas: 1/2^64 (aproximadamente 1 em 18 quintilhões)
     """
-    global _CRC64_TABLE
-    if _CRC64_TABLE is None:
-        _CRC64_TABLE = _calculate_crc_table(_CRC64_POLY)
-    
-    return _crc(data, _CRC64_POLY, _CRC64_MASK, _CRC64_MASK, _CRC64_TABLE)
+    return _crc_engine(data, _CRC64_MASK, _CRC64_MASK, _crc64_tables(), engine)
 
 
-def crc64_incremental(data: bytes, crc: int = CRC64_INIT) -> int:
+def crc64_incremental(data: bytes, crc: int = CRC64_INIT,
+                      engine: str = DEFAULT_ENGINE) -> int:
     """
     Calcula CRC-64 de forma incremental (permite processar dados em partes).
     
@@ -151,8 +697,9 @@ def crc64_incremental(data: bytes, crc: int = CRC64_INIT) -> int:
     que não cabem na memória, como arquivos grandes.
     
     Args:
-        data (bytes): Chunk de dados a processar
+        data (bytes-like): Chunk de dados a processar
         crc (int): Valor CRC acumulado da iteração anterior (padrão: 0xFFFFFFFFFFFFFFFF)
+        engine (str): Engine de cálculo (padrão: DEFAULT_ENGINE)
     
     Returns:
         int: Valor CRC atualizado (SEM XOR final - aplicar manualmente no fim)
@@ -171,12 +718,8 @@ def crc64_incremental(data: bytes, crc: int = CRC64_INIT) -> int:
         >>> print(f"CRC-64: {resultado}")
         13827403126148551023
     """
-    global _CRC64_TABLE
-    if _CRC64_TABLE is None:
-        _CRC64_TABLE = _calculate_crc_table(_CRC64_POLY)
-    
-    # Reutiliza _crc sem aplicar XOR final (xor_out = 0)
-    return _crc(data, _CRC64_POLY, crc, 0, _CRC64_TABLE)
+    # Reutiliza _crc_engine sem aplicar XOR final (xor_out = 0)
+    return _crc_engine(data, crc, 0, _crc64_tables(), engine)
 
 
 # =============================================================================
@@ -188,7 +731,7 @@ def crc64_hex(data: bytes) -> str:
     Calcula CRC-64 e retorna como string hexadecimal.
     
     Args:
-        data (bytes): Dados de entrada
+        data (bytes-like): Dados de entrada
     
     Returns:
         str: CRC-64 formatado como hexadecimal (16 caracteres)
@@ -207,7 +750,7 @@ def crc64_bytes(data: bytes) -> bytes:
     Calcula CRC-64 e retorna como bytes.
     
     Args:
-        data (bytes): Dados de entrada
+        data (bytes-like): Dados de entrada
     
     Returns:
         bytes: CRC-64 como sequência de 8 bytes (big-endian)
@@ -221,7 +764,8 @@ def crc64_bytes(data: bytes) -> bytes:
     return crc64(data).to_bytes(8, byteorder='big')
 
 
-def crc64_file(filepath: str, chunk_size: int = 8192) -> int:
+def crc64_file(filepath: str, chunk_size: int = 8192,
+               engine: str = DEFAULT_ENGINE, workers: int = 1) -> int:
     """
     Calcula CRC-64 de um arquivo lendo em chunks.
     
@@ -230,7 +774,14 @@ def crc64_file(filepath: str, chunk_size: int = 8192) -> int:
     
     Args:
         filepath (str): Caminho completo do arquivo
-        chunk_size (int): Tamanho do chunk em bytes (padrão: 8KB)
+        chunk_size (int): Tamanho do buffer de leitura, reutilizado a cada
+            leitura (padrão: 8KB)
+        engine (str): Engine de cálculo (padrão: DEFAULT_ENGINE)
+        workers (int): Quantidade de processos (padrão: 1 = sequencial).
+            Com workers > 1 o arquivo é mapeado em memória (mmap), dividido
+            em faixas grandes calculadas em um pool de processos e os
+            resultados são unidos com crc64_combine. O valor é idêntico
+            ao do modo sequencial.
     
     Returns:
         int: Valor CRC-64 do arquivo completo
@@ -239,6 +790,12 @@ def crc64_file(filepath: str, chunk_size: int = 8192) -> int:
         FileNotFoundError: Se o arquivo não existir
         IOError: Se houver erro de leitura do arquivo
         PermissionError: Se não houver permissão para ler o arquivo
+        ValueError: Se workers ou chunk_size forem menores que 1 ou
+            se o engine for desconhecido
+    
+    Warning:
+        O modo paralelo cria processos: no Windows, chame-o apenas dentro
+        de um bloco `if __name__ == '__main__':`.
     
     Example:
         >>> crc = crc64_file("documento.pdf")
@@ -247,18 +804,26 @@ def crc64_file(filepath: str, chunk_size: int = 8192) -> int:
         >>> # Verificar integridade
         >>> crc_hex = f"{crc:016x}"
         >>> print(f"Checksum: {crc_hex}")
+        >>> 
+        >>> # Arquivos muito grandes: 8 processos em paralelo
+        >>> crc = crc64_file("backup.tar", workers=8)
     """
-    crc = CRC64_INIT
+    _check_file_args(chunk_size, engine, workers)
     
     try:
-        with open(filepath, 'rb') as f:
-            while chunk := f.read(chunk_size):
-                crc = crc64_incremental(chunk, crc)
-        return crc ^ CRC64_INIT  # XOR final
+        if workers > 1:
+            return _crc_file_parallel(filepath, crc64_incremental, CRC64_INIT,
+                                      crc64_combine, chunk_size, engine,
+                                      workers)
+        
+        return _crc_file_sequential(filepath, crc64_incremental, CRC64_INIT,
+                                    chunk_size, engine)
     except FileNotFoundError:
         raise FileNotFoundError(f"Arquivo não encontrado: {filepath}")
     except PermissionError:
         raise PermissionError(f"Sem permissão para ler o arquivo: {filepath}")
+    except ValueError:
+        raise  # Parâmetros inválidos (ex: engine desconhecido)
     except Exception as e:
         raise IOError(f"Erro ao ler arquivo {filepath}: {e}")
 
@@ -267,18 +832,22 @@ def crc64_file(filepath: str, chunk_size: int = 8192) -> int:
 # CRC-32 - FUNÇÕES PRINCIPAIS
 # =============================================================================
 
-def crc32(data: bytes) -> int:
+def crc32(data: bytes, engine: str = DEFAULT_ENGINE) -> int:
     """
     Calcula o valor CRC-32/ISO-3309 para os dados de entrada.
     
     Args:
-        data (bytes): Os dados de entrada para o cálculo do CRC
+        data (bytes-like): Os dados de entrada para o cálculo do CRC
+            (bytes, bytearray, memoryview, mmap, array NumPy contíguo...)
+        engine (str): Engine de cálculo: ENGINE_BYTEWISE, ENGINE_SLICE8 ou
+            ENGINE_SLICE16 (padrão: DEFAULT_ENGINE)
     
     Returns:
         int: O valor CRC-32 calculado (inteiro positivo de 32 bits)
     
     Raises:
-        TypeError: Se data não for bytes
+        TypeError: Se data não suportar o buffer protocol
+        ValueError: Se engine não for reconhecido
     
     Example:
         >>> crc32(b"123456")
@@ -290,20 +859,18 @@ def crc32(data: bytes) -> int:
         Este hash NÃO deve ser usado para armazenar senhas.
         Colisões conhecidas: 1/2^32 (aproximadamente 1 em 4 bilhões)
     """
-    global _CRC32_TABLE
-    if _CRC32_TABLE is None:
-        _CRC32_TABLE = _calculate_crc_table(_CRC32_POLY)
-    
-    return _crc(data, _CRC32_POLY, _CRC32_MASK, _CRC32_MASK, _CRC32_TABLE)
+    return _crc_engine(data, _CRC32_MASK, _CRC32_MASK, _crc32_tables(), engine)
 
 
-def crc32_incremental(data: bytes, crc: int = CRC32_INIT) -> int:
+def crc32_incremental(data: bytes, crc: int = CRC32_INIT,
+                      engine: str = DEFAULT_ENGINE) -> int:
     """
     Calcula CRC-32 de forma incremental (permite processar dados em partes).
     
     Args:
-        data (bytes): Chunk de dados a processar
+        data (bytes-like): Chunk de dados a processar
         crc (int): Valor CRC acumulado da iteração anterior (padrão: 0xFFFFFFFF)
+        engine (str): Engine de cálculo (padrão: DEFAULT_ENGINE)
     
     Returns:
         int: Valor CRC atualizado (SEM XOR final - aplicar manualmente no fim)
@@ -320,12 +887,8 @@ def crc32_incremental(data: bytes, crc: int = CRC32_INIT) -> int:
         >>> print(f"CRC-32: {resultado}")
         1243066710
     """
-    global _CRC32_TABLE
-    if _CRC32_TABLE is None:
-        _CRC32_TABLE = _calculate_crc_table(_CRC32_POLY)
-    
-    # Reutiliza _crc sem aplicar XOR final (xor_out = 0)
-    return _crc(data, _CRC32_POLY, crc, 0, _CRC32_TABLE)
+    # Reutiliza _crc_engine sem aplicar XOR final (xor_out = 0)
+    return _crc_engine(data, crc, 0, _crc32_tables(), engine)
 
 
 # =============================================================================
@@ -337,7 +900,7 @@ def crc32_hex(data: bytes) -> str:
     Calcula CRC-32 e retorna como string hexadecimal.
     
     Args:
-        data (bytes): Dados de entrada
+        data (bytes-like): Dados de entrada
     
     Returns:
         str: CRC-32 formatado como hexadecimal (8 caracteres)
@@ -356,7 +919,7 @@ def crc32_bytes(data: bytes) -> bytes:
     Calcula CRC-32 e retorna como bytes.
     
     Args:
-        data (bytes): Dados de entrada
+        data (bytes-like): Dados de entrada
     
     Returns:
         bytes: CRC-32 como sequência de 4 bytes (big-endian)
@@ -370,13 +933,18 @@ def crc32_bytes(data: bytes) -> bytes:
     return crc32(data).to_bytes(4, byteorder='big')
 
 
-def crc32_file(filepath: str, chunk_size: int = 8192) -> int:
+def crc32_file(filepath: str, chunk_size: int = 8192,
+               engine: str = DEFAULT_ENGINE, workers: int = 1) -> int:
     """
     Calcula CRC-32 de um arquivo lendo em chunks.
     
     Args:
         filepath (str): Caminho completo do arquivo
-        chunk_size (int): Tamanho do chunk em bytes (padrão: 8KB)
+        chunk_size (int): Tamanho do buffer de leitura, reutilizado a cada
+            leitura (padrão: 8KB)
+        engine (str): Engine de cálculo (padrão: DEFAULT_ENGINE)
+        workers (int): Quantidade de processos (padrão: 1 = sequencial).
+            Veja crc64_file para detalhes do modo paralelo.
     
     Returns:
         int: Valor CRC-32 do arquivo completo
@@ -385,6 +953,8 @@ def crc32_file(filepath: str, chunk_size: int = 8192) -> int:
         FileNotFoundError: Se o arquivo não existir
         IOError: Se houver erro de leitura do arquivo
         PermissionError: Se não houver permissão para ler o arquivo
+        ValueError: Se workers ou chunk_size forem menores que 1 ou
+            se o engine for desconhecido
     
     Example:
         >>> crc = crc32_file("documento.txt")
@@ -396,21 +966,868 @@ def crc32_file(filepath: str, chunk_size: int = 8192) -> int:
         ...     zlib_crc = zlib.crc32(f.read())
         >>> assert crc == zlib_crc
     """
-    crc = CRC32_INIT
+    _check_file_args(chunk_size, engine, workers)
     
     try:
-        with open(filepath, 'rb') as f:
-            while chunk := f.read(chunk_size):
-                crc = crc32_incremental(chunk, crc)
-        return crc ^ CRC32_INIT  # XOR final
+        if workers > 1:
+            return _crc_file_parallel(filepath, crc32_incremental, CRC32_INIT,
+                                      crc32_combine, chunk_size, engine,
+                                      workers)
+        
+        return _crc_file_sequential(filepath, crc32_incremental, CRC32_INIT,
+                                    chunk_size, engine)
     except FileNotFoundError:
         raise FileNotFoundError(f"Arquivo não encontrado: {filepath}")
     except PermissionError:
         raise PermissionError(f"Sem permissão para ler o arquivo: {filepath}")
+    except ValueError:
+        raise  # Parâmetros inválidos (ex: engine desconhecido)
     except Exception as e:
         raise IOError(f"Erro ao ler arquivo {filepath}: {e}")
 
 
+# =============================================================================
+# COMBINAÇÃO E ATUALIZAÇÃO DE CRCs (sem reler os dados)
+# =============================================================================
+
+def crc64_combine(crc_a: int, crc_b: int, len_b: int) -> int:
+    """
+    Combina os CRC-64 de dois blocos adjacentes sem reler os dados.
+    
+    Dado crc_a = crc64(A) e crc_b = crc64(B), retorna crc64(A + B) em
+    O(log(len_b)), usando exponenciação de matrizes em GF(2) sobre o
+    polinômio CRC-64/ISO.
+    
+    Args:
+        crc_a (int): CRC-64 do primeiro bloco
+        crc_b (int): CRC-64 do segundo bloco
+        len_b (int): Tamanho do segundo bloco em bytes
+    
+    Returns:
+        int: CRC-64 da concatenação dos dois blocos
+    
+    Raises:
+        ValueError: Se len_b for negativo
+    
+    Example:
+        >>> a, b = b"Hello ", b"World"
+        >>> crc64_combine(crc64(a), crc64(b), len(b)) == crc64(a + b)
+        True
+    """
+    return _crc_combine(crc_a, crc_b, len_b, _CRC64_POLY, 64)
+
+
+def crc32_combine(crc_a: int, crc_b: int, len_b: int) -> int:
+    """
+    Combina os CRC-32 de dois blocos adjacentes sem reler os dados.
+    
+    Equivalente a zlib.crc32_combine: dado crc_a = crc32(A) e
+    crc_b = crc32(B), retorna crc32(A + B) em O(log(len_b)).
+    
+    Args:
+        crc_a (int): CRC-32 do primeiro bloco
+        crc_b (int): CRC-32 do segundo bloco
+        len_b (int): Tamanho do segundo bloco em bytes
+    
+    Returns:
+        int: CRC-32 da concatenação dos dois blocos
+    
+    Raises:
+        ValueError: Se len_b for negativo
+    
+    Example:
+        >>> a, b = b"Hello ", b"World"
+        >>> crc32_combine(crc32(a), crc32(b), len(b)) == crc32(a + b)
+        True
+    """
+    return _crc_combine(crc_a, crc_b, len_b, _CRC32_POLY, 32)
+
+
+def _crc_patch(crc, length, offset, old, new, crc_tables, crc_poly, width):
+    """
+    Atualiza o CRC após substituir old por new na posição offset.
+    
+    Pela linearidade do CRC, CRC(M) ^ CRC(M') depende apenas da diferença
+    D = old ^ new: é o CRC "puro" (init 0, sem XOR final) de D, deslocado
+    pelos bytes que vêm depois da região alterada. Os zeros antes de D não
+    alteram um registrador nulo e por isso não precisam ser processados.
+    
+    Raises:
+        ValueError: Se old e new tiverem tamanhos diferentes ou a região
+            não couber no arquivo
+    """
+    old = _as_byte_view(old)
+    new = _as_byte_view(new)
+    size = len(old)
+    if len(new) != size:
+        raise ValueError(
+            f"old e new devem ter o mesmo tamanho ({size} != {len(new)})")
+    if offset < 0 or offset + size > length:
+        raise ValueError(
+            f"Região [{offset}, {offset + size}) fora do arquivo de {length} bytes")
+    
+    if not size:
+        return crc
+    
+    delta = (int.from_bytes(old, 'little') ^
+             int.from_bytes(new, 'little')).to_bytes(size, 'little')
+    delta_crc = _crc_engine(delta, 0, 0, crc_tables, DEFAULT_ENGINE)
+    return crc ^ _crc_shift(delta_crc, length - offset - size, crc_poly, width)
+
+
+def crc64_patch(crc: int, length: int, offset: int, old: bytes,
+                new: bytes) -> int:
+    """
+    Recalcula o CRC-64 de um arquivo após uma edição in-place.
+    
+    Em vez de reler o arquivo inteiro, usa apenas os bytes antigos e novos
+    da região alterada: o custo é proporcional ao tamanho da edição mais
+    log(tamanho do arquivo).
+    
+    Args:
+        crc (int): CRC-64 do arquivo antes da edição
+        length (int): Tamanho do arquivo em bytes (inalterado pela edição)
+        offset (int): Posição do primeiro byte alterado
+        old (bytes-like): Conteúdo antigo da região
+        new (bytes-like): Conteúdo novo da região (mesmo tamanho de old)
+    
+    Returns:
+        int: CRC-64 do arquivo após a edição
+    
+    Raises:
+        ValueError: Se old e new tiverem tamanhos diferentes ou a região
+            não couber no arquivo
+    
+    Example:
+        >>> data = b"id=0001;valor=100;"
+        >>> novo = data[:14] + b"250" + data[17:]
+        >>> crc64_patch(crc64(data), len(data), 14, b"100", b"250") == crc64(novo)
+        True
+    """
+    return _crc_patch(crc, length, offset, old, new, _crc64_tables(),
+                      _CRC64_POLY, 64)
+
+
+def crc32_patch(crc: int, length: int, offset: int, old: bytes,
+                new: bytes) -> int:
+    """
+    Recalcula o CRC-32 de um arquivo após uma edição in-place.
+    
+    Veja crc64_patch.
+    
+    Example:
+        >>> data = b"id=0001;valor=100;"
+        >>> novo = data[:14] + b"250" + data[17:]
+        >>> crc32_patch(crc32(data), len(data), 14, b"100", b"250") == crc32(novo)
+        True
+    """
+    return _crc_patch(crc, length, offset, old, new, _crc32_tables(),
+                      _CRC32_POLY, 32)
+
+
+# =============================================================================
+# CÁLCULO EM LOTE (muitos registros curtos, requer NumPy)
+# =============================================================================
+
+def crc64_many(items, offsets=None):
+    """
+    Calcula o CRC-64 de muitos registros de uma vez, retornando array NumPy.
+    
+    Indicado para milhões de registros curtos (chaves, códigos), onde o
+    custo de uma chamada Python por registro domina. Os lookups de tabela
+    de todos os registros avançam juntos com operações vetoriais do NumPy.
+    
+    Args:
+        items: Sequência de objetos bytes-like (list, Series, array de
+            objetos...) ou, com offsets, um buffer único com todos os
+            registros concatenados
+        offsets: Posições de início dos registros em items, com n+1
+            valores (layout offsets+data do Apache Arrow). Padrão: None
+    
+    Returns:
+        numpy.ndarray: Array uint64 com o CRC-64 de cada registro
+    
+    Raises:
+        ImportError: Se o NumPy não estiver instalado
+        TypeError: Se algum registro não for bytes-like
+        ValueError: Se offsets for inválido
+    
+    Example:
+        >>> crc64_many([b"123456", b"Hello World"]).tolist() == [
+        ...     crc64(b"123456"), crc64(b"Hello World")]
+        True
+        >>> # Layout Arrow: buffer de dados + offsets
+        >>> crc64_many(b"abcde", offsets=[0, 2, 5]).tolist() == [
+        ...     crc64(b"ab"), crc64(b"cde")]
+        True
+    
+    Note:
+        O número de iterações é o tamanho do maior registro. Para poucos
+        registros longos, prefira crc64() ou crc64_file().
+    """
+    return _crc_many(items, offsets, _crc64_tables()[0], _CRC64_POLY,
+                     _CRC64_MASK, 'uint64')
+
+
+def crc32_many(items, offsets=None):
+    """
+    Calcula o CRC-32 de muitos registros de uma vez, retornando array NumPy.
+    
+    Veja crc64_many para detalhes dos formatos de entrada.
+    
+    Args:
+        items: Sequência de objetos bytes-like ou buffer único (com offsets)
+        offsets: Posições de início dos registros (n+1 valores). Padrão: None
+    
+    Returns:
+        numpy.ndarray: Array uint32 com o CRC-32 de cada registro
+    
+    Raises:
+        ImportError: Se o NumPy não estiver instalado
+        TypeError: Se algum registro não for bytes-like
+        ValueError: Se offsets for inválido
+    
+    Example:
+        >>> crc32_many([b"123456", b""]).tolist() == [crc32(b"123456"), 0]
+        True
+    """
+    return _crc_many(items, offsets, _crc32_tables()[0], _CRC32_POLY,
+                     _CRC32_MASK, 'uint32')
+
+
+# =============================================================================
+# CHUNKING DEFINIDO PELO CONTEÚDO (deduplicação)
+# =============================================================================
+
+def _gear_table():
+    """Retorna (e gera sob demanda) a tabela fixa do gear hash."""
+    global _GEAR_TABLE
+    if _GEAR_TABLE is None:
+        _GEAR_TABLE = [int.from_bytes(md5(bytes([i])).digest()[:8], 'little')
+                       for i in range(256)]
+    return _GEAR_TABLE
+
+
+def _cdc_masks(avg_size):
+    """
+    Máscaras do chunking normalizado (FastCDC): antes do tamanho médio
+    exige 1 bit a mais (corte mais difícil) e depois 1 bit a menos.
+    Os bits ficam no topo do hash, que depende dos últimos 64 bytes.
+    """
+    bits = max(avg_size.bit_length() - 1, 1)
+    mask_small = ((1 << (bits + 1)) - 1) << (64 - bits - 1)
+    mask_large = ((1 << (bits - 1)) - 1) << (64 - bits + 1)
+    return mask_small, mask_large
+
+
+def _cdc_cut(buffer, size, min_size, avg_size, max_size, mask_small, mask_large):
+    """
+    Retorna o tamanho do próximo chunk no início de buffer.
+    
+    O gear hash é calculado a partir de min_size; o primeiro ponto em que
+    os bits da máscara zeram define o corte. Sem corte, usa max_size (ou
+    o fim dos dados).
+    """
+    if size <= min_size:
+        return size
+    
+    gear = _gear_table()
+    h = 0
+    i = min_size
+    normal = min(avg_size, size)
+    end = min(max_size, size)
+    
+    while i < normal:
+        h = ((h << 1) + gear[buffer[i]]) & _CRC64_MASK
+        i += 1
+        if not h & mask_small:
+            return i
+    
+    while i < end:
+        h = ((h << 1) + gear[buffer[i]]) & _CRC64_MASK
+        i += 1
+        if not h & mask_large:
+            return i
+    
+    return end
+
+
+def cdc_chunks(source, min_size: int = CDC_MIN_SIZE,
+               avg_size: int = CDC_AVG_SIZE, max_size: int = CDC_MAX_SIZE,
+               engine: str = DEFAULT_ENGINE):
+    """
+    Divide um stream em chunks definidos pelo conteúdo (gear hash/FastCDC).
+    
+    Os pontos de corte dependem apenas dos bytes próximos, então uma
+    inserção ou remoção altera somente os chunks vizinhos: arquivos quase
+    idênticos compartilham a maior parte dos chunks (e de seus CRCs). O
+    stream é lido em blocos; a memória usada é limitada a max_size + 1MB.
+    
+    Args:
+        source: Caminho do arquivo ou objeto binário com read()
+        min_size (int): Tamanho mínimo do chunk (padrão: 2KB)
+        avg_size (int): Tamanho médio desejado (padrão: 8KB)
+        max_size (int): Tamanho máximo do chunk (padrão: 64KB)
+        engine (str): Engine do CRC-64 (padrão: DEFAULT_ENGINE)
+    
+    Yields:
+        tuple: (offset, length, crc64) de cada chunk, em ordem
+    
+    Raises:
+        ValueError: Se não valer 0 < min_size <= avg_size <= max_size
+    
+    Example:
+        >>> store = {}
+        >>> for offset, length, crc in cdc_chunks("export.csv"):
+        ...     store.setdefault(crc, (offset, length))
+    """
+    if not 0 < min_size <= avg_size <= max_size:
+        raise ValueError(
+            f"Esperado 0 < min_size <= avg_size <= max_size, recebido "
+            f"{min_size}, {avg_size}, {max_size}"
+        )
+    
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            yield from cdc_chunks(f, min_size, avg_size, max_size, engine)
+        return
+    
+    mask_small, mask_large = _cdc_masks(avg_size)
+    tables = _crc64_tables()
+    buffer = bytearray()
+    offset = 0
+    eof = False
+    
+    while True:
+        while not eof and len(buffer) < max_size:
+            block = source.read(_CDC_READ_SIZE)
+            if block:
+                buffer += block
+            else:
+                eof = True
+        
+        size = len(buffer)
+        if not size:
+            break
+        
+        cut = _cdc_cut(buffer, size, min_size, avg_size, max_size,
+                       mask_small, mask_large)
+        with memoryview(buffer) as view, view[:cut] as chunk:
+            crc = _crc_engine(chunk, _CRC64_MASK, _CRC64_MASK, tables, engine)
+        
+        yield offset, cut, crc
+        del buffer[:cut]
+        offset += cut
+
+
+# =============================================================================
+# API ASSÍNCRONA (asyncio)
+# =============================================================================
+
+def _async_executor():
+    """
+    Retorna o executor padrão da API assíncrona (criado sob demanda).
+    
+    O cálculo de CRC em Python puro segura o GIL, por isso o padrão é um
+    pool de processos limitado à quantidade de CPUs.
+    """
+    global _ASYNC_EXECUTOR
+    if _ASYNC_EXECUTOR is None:
+        _ASYNC_EXECUTOR = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _ASYNC_EXECUTOR
+
+
+def _aligned_chunk_size(chunk_size):
+    """Arredonda chunk_size para cima, até um múltiplo do tamanho de página."""
+    page = mmap.PAGESIZE
+    return max(page, -(-chunk_size // page) * page)
+
+
+async def afiles(afile, paths, concurrency: int = ASYNC_CONCURRENCY, **kwargs):
+    """
+    Aplica uma função assíncrona a muitos arquivos com limite de concorrência.
+    
+    No máximo `concurrency` arquivos ficam em processamento ao mesmo tempo
+    (inclusive para iteráveis muito grandes ou infinitos) e os resultados
+    são produzidos na ordem em que terminam.
+    
+    Args:
+        afile (callable): Função assíncrona afile(path, **kwargs)
+        paths: Iterável de caminhos
+        concurrency (int): Máximo de arquivos simultâneos (padrão: 8)
+        **kwargs: Repassados a afile
+    
+    Yields:
+        tuple: (path, resultado) em ordem de conclusão
+    
+    Raises:
+        ValueError: Se concurrency for menor que 1
+        Exception: O primeiro erro de afile interrompe a iteração; os
+            arquivos ainda pendentes são cancelados
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency deve ser >= 1, recebido {concurrency}")
+    
+    async def run(path):
+        return path, await afile(path, **kwargs)
+    
+    paths = iter(paths)
+    pending = set()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < concurrency:
+                try:
+                    pending.add(asyncio.ensure_future(run(next(paths))))
+                except StopIteration:
+                    exhausted = True
+            if not pending:
+                break
+            
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def acrc64_file(filepath: str, chunk_size: int = ASYNC_CHUNK_SIZE,
+                      engine: str = DEFAULT_ENGINE, executor=None) -> int:
+    """
+    Versão assíncrona de crc64_file: não bloqueia o event loop.
+    
+    A leitura e o cálculo rodam em um executor (padrão: pool de processos
+    limitado ao número de CPUs), com buffer grande alinhado à página.
+    
+    Args:
+        filepath (str): Caminho completo do arquivo
+        chunk_size (int): Tamanho do buffer de leitura (padrão: 1MB)
+        engine (str): Engine de cálculo (padrão: DEFAULT_ENGINE)
+        executor: concurrent.futures.Executor a usar (opcional)
+    
+    Returns:
+        int: Valor CRC-64 do arquivo completo
+    
+    Raises:
+        FileNotFoundError, PermissionError, IOError: Como em crc64_file
+    
+    Example:
+        >>> crc = await acrc64_file("upload.bin")
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor or _async_executor(), crc64_file, filepath,
+        _aligned_chunk_size(chunk_size), engine)
+
+
+async def acrc32_file(filepath: str, chunk_size: int = ASYNC_CHUNK_SIZE,
+                      engine: str = DEFAULT_ENGINE, executor=None) -> int:
+    """
+    Versão assíncrona de crc32_file (veja acrc64_file).
+    
+    Returns:
+        int: Valor CRC-32 do arquivo completo
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor or _async_executor(), crc32_file, filepath,
+        _aligned_chunk_size(chunk_size), engine)
+
+
+def acrc64_files(paths, concurrency: int = ASYNC_CONCURRENCY, **kwargs):
+    """
+    Calcula o CRC-64 de muitos arquivos de forma assíncrona.
+    
+    Args:
+        paths: Iterável de caminhos
+        concurrency (int): Máximo de arquivos simultâneos (padrão: 8)
+        **kwargs: Repassados a acrc64_file (chunk_size, engine, executor)
+    
+    Returns:
+        Async iterator de (path, crc) em ordem de conclusão
+    
+    Example:
+        >>> async for path, crc in acrc64_files(uploads, concurrency=4):
+        ...     print(path, f"{crc:016x}")
+    """
+    return afiles(acrc64_file, paths, concurrency, **kwargs)
+
+
+def acrc32_files(paths, concurrency: int = ASYNC_CONCURRENCY, **kwargs):
+    """
+    Calcula o CRC-32 de muitos arquivos de forma assíncrona (veja acrc64_files).
+    
+    Returns:
+        Async iterator de (path, crc) em ordem de conclusão
+    """
+    return afiles(acrc32_file, paths, concurrency, **kwargs)
+
+
+# =============================================================================
+# OBJETOS HASHER (interface do hashlib: update/digest/hexdigest/copy)
+# =============================================================================
+
+class _CrcHasher:
+    """
+    Base dos hashers CRC no estilo hashlib.
+    
+    O registrador fica no objeto (sem XOR final) e as tabelas são obtidas
+    uma única vez, no construtor, em vez de a cada chamada.
+    Subclasses definem name, digest_size, _mask e _get_tables.
+    """
+    __slots__ = ('_crc', '_tables', '_engine')
+    
+    name = None
+    digest_size = None
+    block_size = 1
+    _mask = None
+    _get_tables = None
+    
+    def __init__(self, data: bytes = b'', engine: str = DEFAULT_ENGINE):
+        self._crc = self._mask
+        self._tables = type(self)._get_tables()
+        self._engine = engine
+        self.update(data)  # Buffer vazio não altera o CRC
+    
+    def __repr__(self):
+        return f"<{self.name} hasher: {self.hexdigest()}>"
+    
+    def update(self, data: bytes) -> None:
+        """Processa mais um chunk (bytes-like) de dados."""
+        self._crc = _crc_engine(data, self._crc, 0, self._tables, self._engine)
+    
+    def intdigest(self) -> int:
+        """Retorna o CRC dos dados processados até agora como inteiro."""
+        return self._crc ^ self._mask
+    
+    def digest(self) -> bytes:
+        """Retorna o CRC como bytes (big-endian, igual a crc64_bytes)."""
+        return self.intdigest().to_bytes(self.digest_size, byteorder='big')
+    
+    def hexdigest(self) -> str:
+        """Retorna o CRC como string hexadecimal (igual a crc64_hex)."""
+        return f"{self.intdigest():0{self.digest_size * 2}x}"
+    
+    def copy(self):
+        """Retorna uma cópia independente do estado atual."""
+        other = object.__new__(type(self))
+        other._crc = self._crc
+        other._tables = self._tables
+        other._engine = self._engine
+        return other
+
+
+class CRC64(_CrcHasher):
+    """
+    Hasher CRC-64 com a interface do hashlib.
+    
+    Substitui o encadeamento manual de crc64_incremental, aplicando o XOR
+    final automaticamente em digest(), hexdigest() e intdigest().
+    
+    Args:
+        data (bytes-like): Dados iniciais (opcional)
+        engine (str): Engine de cálculo (padrão: DEFAULT_ENGINE)
+    
+    Example:
+        >>> h = CRC64(b"Hello")
+        >>> h.update(b" World")
+        >>> h.intdigest() == crc64(b"Hello World")
+        True
+        >>> h.hexdigest() == crc64_hex(b"Hello World")
+        True
+    """
+    __slots__ = ()
+    name = 'crc64'
+    digest_size = 8
+    _mask = _CRC64_MASK
+    _get_tables = staticmethod(_crc64_tables)
+
+
+class CRC32(_CrcHasher):
+    """
+    Hasher CRC-32 com a interface do hashlib.
+    
+    Args:
+        data (bytes-like): Dados iniciais (opcional)
+        engine (str): Engine de cálculo (padrão: DEFAULT_ENGINE)
+    
+    Example:
+        >>> h = CRC32(b"Hello")
+        >>> h2 = h.copy()
+        >>> h2.update(b" World")
+        >>> h2.hexdigest(), h.hexdigest() == crc32_hex(b"Hello")
+        ('4a17b156', True)
+    """
+    __slots__ = ()
+    name = 'crc32'
+    digest_size = 4
+    _mask = _CRC32_MASK
+    _get_tables = staticmethod(_crc32_tables)
+
+
+# =============================================================================
+# MODELO PARAMÉTRICO (Rocksoft: width, poly, init, refin, refout, xorout)
+# =============================================================================
+
+# Catálogo de presets: nome -> (width, poly, init, refin, refout, xorout, check)
+# poly na forma normal (não refletida); check = CRC de b"123456789".
+CRC_PRESETS = {
+    'CRC-8/SMBUS':      (8, 0x07, 0x00, False, False, 0x00, 0xF4),
+    'CRC-16/ARC':       (16, 0x8005, 0x0000, True, True, 0x0000, 0xBB3D),
+    'CRC-16/IBM-3740':  (16, 0x1021, 0xFFFF, False, False, 0x0000, 0x29B1),
+    'CRC-16/KERMIT':    (16, 0x1021, 0x0000, True, True, 0x0000, 0x2189),
+    'CRC-16/MODBUS':    (16, 0x8005, 0xFFFF, True, True, 0x0000, 0x4B37),
+    'CRC-16/XMODEM':    (16, 0x1021, 0x0000, False, False, 0x0000, 0x31C3),
+    'CRC-32/ISO-HDLC':  (32, 0x04C11DB7, 0xFFFFFFFF, True, True,
+                         0xFFFFFFFF, 0xCBF43926),
+    'CRC-32/ISCSI':     (32, 0x1EDC6F41, 0xFFFFFFFF, True, True,
+                         0xFFFFFFFF, 0xE3069283),
+    'CRC-32/BZIP2':     (32, 0x04C11DB7, 0xFFFFFFFF, False, False,
+                         0xFFFFFFFF, 0xFC891918),
+    'CRC-32/MPEG-2':    (32, 0x04C11DB7, 0xFFFFFFFF, False, False,
+                         0x00000000, 0x0376E6E7),
+    'CRC-64/ECMA-182':  (64, 0x42F0E1EBA9EA3693, 0x0, False, False,
+                         0x0, 0x6C40DF5F0B497347),
+    'CRC-64/XZ':        (64, 0x42F0E1EBA9EA3693, _CRC64_MASK, True, True,
+                         _CRC64_MASK, 0x995DC9BBDF1939FA),
+    'CRC-64/GO-ISO':    (64, 0x000000000000001B, _CRC64_MASK, True, True,
+                         _CRC64_MASK, 0xB90956C775A41001),
+    'CRC-64/NVME':      (64, 0xAD93D23594C93659, _CRC64_MASK, True, True,
+                         _CRC64_MASK, 0xAE8B14860A799888),
+    # Mesmo resultado de crc64() deste módulo (polinômio usado refletido)
+    'CRC-64/MYCRC':     (64, 0xC96C5795D7870F42, _CRC64_MASK, True, True,
+                         _CRC64_MASK, 0xB86883E6FA710A9F),
+}
+
+# Nomes alternativos usados em formatos e bibliotecas
+CRC_PRESET_ALIASES = {
+    'CRC-8': 'CRC-8/SMBUS',
+    'CRC-16': 'CRC-16/ARC',
+    'CRC-16/CCITT-FALSE': 'CRC-16/IBM-3740',
+    'CRC-32': 'CRC-32/ISO-HDLC',
+    'CRC-32C': 'CRC-32/ISCSI',
+    'CRC-64/ECMA': 'CRC-64/ECMA-182',
+    'CRC-64/ISO': 'CRC-64/MYCRC',
+}
+
+# Tabela para inverter a ordem dos bits de cada byte (modelos refin=False)
+_REVERSED_BYTES = bytes(int(f'{i:08b}'[::-1], 2) for i in range(256))
+
+
+def _reflect(value, width):
+    """Inverte a ordem dos width bits menos significativos de value."""
+    return int(f'{value:0{width}b}'[::-1], 2)
+
+
+@lru_cache(maxsize=16)
+def _crc_model_tables(crc_poly):
+    """
+    Retorna as tabelas de slicing de um polinômio refletido.
+    
+    Registro limitado (LRU): cada polinômio é calculado no máximo uma vez
+    por processo enquanto estiver entre os 16 mais usados.
+    """
+    return _calculate_crc_slice_tables(_calculate_crc_table(crc_poly))
+
+
+class CrcModel:
+    """
+    CRC parametrizado pelo modelo Rocksoft (width, poly, init, refin,
+    refout, xorout), com as mesmas APIs de crc64: cálculo direto,
+    incremental, combinação e arquivos (inclusive em paralelo).
+    
+    Internamente o registrador é sempre processado na forma refletida
+    (LSB primeiro), reutilizando os engines de slicing. Modelos com
+    refin=False têm os bits de cada byte invertidos antes do cálculo, o que
+    exige uma cópia de cada bloco de dados.
+    
+    Args:
+        width (int): Largura em bits (múltiplo de 8, de 8 a 64)
+        poly (int): Polinômio na forma normal (não refletida)
+        init (int): Valor inicial do registrador (padrão: 0)
+        refin (bool): Bytes de entrada refletidos (padrão: True)
+        refout (bool): Resultado refletido (padrão: True)
+        xorout (int): XOR final (padrão: 0)
+        check (int): CRC esperado de b"123456789" (opcional, informativo)
+        name (str): Nome do modelo (opcional)
+    
+    Raises:
+        ValueError: Se width ou algum parâmetro não couber em width bits
+    
+    Example:
+        >>> crc32c = crc_model('CRC-32C')
+        >>> hex(crc32c(b"123456789"))
+        '0xe3069283'
+        >>> crc = crc32c.incremental(b"12345")
+        >>> crc = crc32c.incremental(b"6789", crc)
+        >>> crc32c.finalize(crc) == crc32c.check
+        True
+    """
+    __slots__ = ('name', 'width', 'poly', 'init', 'refin', 'refout', 'xorout',
+                 'check', 'start', '_poly_reflected', '_tables')
+    
+    def __init__(self, width: int, poly: int, init: int = 0, refin: bool = True,
+                 refout: bool = True, xorout: int = 0, check: int = None,
+                 name: str = None):
+        if width % 8 or not 8 <= width <= 64:
+            raise ValueError(f"width deve ser múltiplo de 8 entre 8 e 64, recebido {width}")
+        for param, value in (('poly', poly), ('init', init), ('xorout', xorout)):
+            if not 0 <= value < (1 << width):
+                raise ValueError(f"{param}=0x{value:x} não cabe em {width} bits")
+        
+        self.name = name or f'CRC-{width}/0x{poly:0{width // 4}X}'
+        self.width = width
+        self.poly = poly
+        self.init = init
+        self.refin = refin
+        self.refout = refout
+        self.xorout = xorout
+        self.check = check
+        
+        # Valor inicial do registrador refletido (usar em incremental)
+        self.start = _reflect(init, width)
+        self._poly_reflected = _reflect(poly, width)
+        self._tables = _crc_model_tables(self._poly_reflected)
+    
+    def __reduce__(self):
+        # Envia apenas os parâmetros ao pool de processos; as tabelas são
+        # recriadas (uma vez) pelo registro do processo de destino.
+        return (CrcModel, (self.width, self.poly, self.init, self.refin,
+                           self.refout, self.xorout, self.check, self.name))
+    
+    def __repr__(self):
+        digits = self.width // 4
+        return (f"CrcModel(name='{self.name}', width={self.width}, "
+                f"poly=0x{self.poly:0{digits}x}, init=0x{self.init:0{digits}x}, "
+                f"refin={self.refin}, refout={self.refout}, "
+                f"xorout=0x{self.xorout:0{digits}x})")
+    
+    def __call__(self, data: bytes, engine: str = DEFAULT_ENGINE) -> int:
+        return self.compute(data, engine)
+    
+    def compute(self, data: bytes, engine: str = DEFAULT_ENGINE) -> int:
+        """Calcula o CRC de data (bytes-like) com o engine informado."""
+        return self.finalize(self.incremental(data, self.start, engine))
+    
+    def incremental(self, data: bytes, crc: int = None,
+                    engine: str = DEFAULT_ENGINE) -> int:
+        """
+        Processa um chunk e retorna o registrador atualizado.
+        
+        Comece com crc=None (ou self.start) e aplique finalize() no fim,
+        do mesmo modo que crc64_incremental exige o XOR final manual.
+        """
+        if crc is None:
+            crc = self.start
+        if not self.refin:
+            data = _as_byte_view(data).tobytes().translate(_REVERSED_BYTES)
+        return _crc_engine(data, crc, 0, self._tables, engine)
+    
+    def finalize(self, crc: int) -> int:
+        """Converte o registrador de incremental() no valor final do CRC."""
+        if not self.refout:
+            crc = _reflect(crc, self.width)
+        return crc ^ self.xorout
+    
+    def _register(self, value: int) -> int:
+        """Operação inversa de finalize (valor final -> registrador)."""
+        value ^= self.xorout
+        return value if self.refout else _reflect(value, self.width)
+    
+    def hex(self, data: bytes) -> str:
+        """Calcula o CRC e retorna como string hexadecimal (width/4 chars)."""
+        return f"{self.compute(data):0{self.width // 4}x}"
+    
+    def bytes(self, data: bytes) -> bytes:
+        """Calcula o CRC e retorna como bytes (big-endian, width/8 bytes)."""
+        return self.compute(data).to_bytes(self.width // 8, byteorder='big')
+    
+    def combine(self, crc_a: int, crc_b: int, len_b: int) -> int:
+        """
+        Combina os CRCs de dois blocos adjacentes: CRC(A + B).
+        
+        Raises:
+            ValueError: Se len_b for negativo
+        """
+        shifted = _crc_combine(self._register(crc_a) ^ self.start,
+                               self._register(crc_b) ^ self.start,
+                               len_b, self._poly_reflected, self.width)
+        return self.finalize(shifted ^ self.start)
+    
+    def file(self, filepath: str, chunk_size: int = 8192,
+             engine: str = DEFAULT_ENGINE, workers: int = 1) -> int:
+        """
+        Calcula o CRC de um arquivo (mesmos parâmetros de crc64_file).
+        
+        Raises:
+            FileNotFoundError: Se o arquivo não existir
+            IOError: Se houver erro de leitura do arquivo
+            PermissionError: Se não houver permissão para ler o arquivo
+            ValueError: Se workers ou chunk_size forem menores que 1 ou
+                se o engine for desconhecido
+        """
+        _check_file_args(chunk_size, engine, workers)
+        
+        try:
+            if workers > 1:
+                combine = partial(_crc_combine, crc_poly=self._poly_reflected,
+                                  width=self.width)
+                crc = _crc_file_parallel(filepath, self.incremental, self.start,
+                                         combine, chunk_size, engine, workers)
+            else:
+                crc = _crc_file_sequential(filepath, self.incremental,
+                                           self.start, chunk_size, engine)
+            return self.finalize(crc ^ self.start)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Arquivo não encontrado: {filepath}")
+        except PermissionError:
+            raise PermissionError(f"Sem permissão para ler o arquivo: {filepath}")
+        except ValueError:
+            raise  # Parâmetros inválidos (ex: engine desconhecido)
+        except Exception as e:
+            raise IOError(f"Erro ao ler arquivo {filepath}: {e}")
+
+
+@lru_cache(maxsize=None)
+def _preset_model(key: str) -> CrcModel:
+    """CrcModel de um preset pelo nome canônico (no máximo um por preset)."""
+    width, poly, init, refin, refout, xorout, check = CRC_PRESETS[key]
+    return CrcModel(width, poly, init, refin, refout, xorout, check, name=key)
+
+
+def crc_model(name: str) -> CrcModel:
+    """
+    Retorna o CrcModel de um preset do catálogo (criado uma vez por processo).
+    
+    Args:
+        name (str): Nome do preset (CRC_PRESETS) ou alias (CRC_PRESET_ALIASES),
+            sem diferenciar maiúsculas/minúsculas
+    
+    Returns:
+        CrcModel: Modelo pronto para uso
+    
+    Raises:
+        ValueError: Se o preset não existir
+    
+    Example:
+        >>> crc_model('CRC-64/XZ').hex(b"123456789")
+        '995dc9bbdf1939fa'
+        >>> crc_model('CRC-32')(b"123456") == crc32(b"123456")
+        True
+    """
+    key = name.upper()
+    key = CRC_PRESET_ALIASES.get(key, key)
+    if key not in CRC_PRESETS:
+        raise ValueError(
+            f"Preset CRC desconhecido: '{name}'. "
+            f"Disponíveis: {', '.join(sorted(CRC_PRESETS))}"
+        )
+    
+    return _preset_model(key)
+
+
 # =============================================================================
 # FUNÇÕES LEGADAS (Compatibilidade com código antigo)
 # =============================================================================
@@ -466,6 +1883,10 @@ __all__ = [
     # Constantes públicas
     'CRC64_INIT',
     'CRC32_INIT',
+    'ENGINE_BYTEWISE',
+    'ENGINE_SLICE8',
+    'ENGINE_SLICE16',
+    'DEFAULT_ENGINE',
     
     # CRC-64
     'crc64',
@@ -481,6 +1902,41 @@ __all__ = [
     'crc32_bytes',
     'crc32_file',
     
+    # Combinação
+    'crc64_combine',
+    'crc32_combine',
+    'crc64_patch',
+    'crc32_patch',
+    
+    # Lote
+    'crc64_many',
+    'crc32_many',
+    
+    # Chunking definido pelo conteúdo
+    'CDC_MIN_SIZE',
+    'CDC_AVG_SIZE',
+    'CDC_MAX_SIZE',
+    'cdc_chunks',
+    
+    # Assíncrono
+    'ASYNC_CHUNK_SIZE',
+    'ASYNC_CONCURRENCY',
+    'afiles',
+    'acrc64_file',
+    'acrc32_file',
+    'acrc64_files',
+    'acrc32_files',
+    
+    # Hashers
+    'CRC64',
+    'CRC32',
+    
+    # Modelo paramétrico
+    'CRC_PRESETS',
+    'CRC_PRESET_ALIASES',
+    'CrcModel',
+    'crc_model',
+    
     # Legado
     'crc',
     'crc_str',
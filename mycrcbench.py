@@ -0,0 +1,344 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark de throughput (MB/s) e latência dos engines de mycrc.
+
+Mede crc32, crc64, as variantes incrementais (alimentadas em chunks) e
+crc64_file, variando o tamanho do payload (16 B a 1 GiB), o tamanho do
+chunk e o engine. zlib.crc32 é incluído como referência. Os resultados
+são gravados em JSON para comparação entre execuções.
+
+Com --keys, mede também os hashes de chave de 64 bits de myhash
+(hash_md5_int64, hash_crc64_int64 e hash_blake64_int64), chave a chave
+e em coluna, sobre chaves curtas como IDs de partição.
+
+Created on Sun Oct 18 2026
+@author: uendelrocha@gmail.com
+
+Uso:
+    python -m my.mycrcbench --max-size 16M --output bench.json
+    python -m my.mycrcbench --output novo.json --compare bench.json
+    python -m my.mycrcbench --keys 100000 --sizes 16 --no-file
+
+Example:
+    >>> from my.mycrcbench import run_benchmarks, save_results
+    >>> results = run_benchmarks(sizes=[16, 4096], chunk_sizes=[8192])
+    >>> save_results(results, "bench.json")
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import zlib
+from datetime import datetime
+
+from my import mycrc, myhash
+
+# =============================================================================
+# CONSTANTES
+# =============================================================================
+
+KiB = 1024
+MiB = 1024 * KiB
+GiB = 1024 * MiB
+
+# Tamanhos de payload: 16 B a 1 GiB (potências de 16)
+DEFAULT_SIZES = [16, 256, 4 * KiB, 64 * KiB, MiB, 16 * MiB, 256 * MiB, GiB]
+
+# Tamanhos de chunk para as funções incrementais e de arquivo
+DEFAULT_CHUNK_SIZES = [8 * KiB, 64 * KiB, MiB]
+
+ENGINES = [mycrc.ENGINE_BYTEWISE, mycrc.ENGINE_SLICE8, mycrc.ENGINE_SLICE16]
+
+# Tempo mínimo de medição por caso (repete a chamada até atingi-lo)
+DEFAULT_MIN_TIME = 0.2
+
+# Hashes de chave de 64 bits: (nome, função escalar, função de coluna)
+KEY_HASHES = [
+    ('hash_md5_int64', myhash.hash_md5_int64, myhash.hash_md5_int64_column),
+    ('hash_crc64_int64', myhash.hash_crc64_int64, myhash.hash_crc64_int64_column),
+    ('hash_blake64_int64', myhash.hash_blake64_int64, myhash.hash_blake64_int64_column),
+]
+
+
+# =============================================================================
+# MEDIÇÃO
+# =============================================================================
+
+def _measure(func, min_time):
+    """
+    Executa func repetidamente até somar min_time segundos.
+
+    A primeira chamada é o aquecimento e absorve custos únicos (imports
+    tardios como o do NumPy, montagem de tabelas, caches). Ela fica fora da
+    medição, exceto quando sozinha já passa de min_time (payloads grandes):
+    nesse caso é o próprio resultado, sem repetir a chamada.
+
+    Returns:
+        tuple: (chamadas, segundos totais)
+    """
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    if elapsed >= min_time:
+        return 1, elapsed
+    calls = 0
+    batch = 1
+    start = time.perf_counter()
+    while True:
+        for _ in range(batch):
+            func()
+        calls += batch
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return calls, elapsed
+        batch *= 2
+
+
+def _result(function, engine, size, chunk_size, calls, seconds):
+    per_call = seconds / calls
+    return {
+        'function': function,
+        'engine': engine,
+        'size': size,
+        'chunk_size': chunk_size,
+        'calls': calls,
+        'seconds': seconds,
+        'latency_us': per_call * 1e6,
+        'mb_per_s': size / per_call / MiB if per_call else 0.0,
+    }
+
+
+def _feed(incremental, data, chunk_size, engine, init):
+    """Alimenta uma função incremental com data em chunks (sem cópias)."""
+    view = memoryview(data)
+    crc = init
+    for pos in range(0, len(view), chunk_size):
+        crc = incremental(view[pos:pos + chunk_size], crc, engine)
+    return crc
+
+
+def run_benchmarks(sizes=None, chunk_sizes=None, engines=None,
+                   min_time: float = DEFAULT_MIN_TIME, file_bench: bool = True,
+                   verbose: bool = False):
+    """
+    Executa o benchmark completo.
+
+    Args:
+        sizes (list): Tamanhos de payload em bytes (padrão: DEFAULT_SIZES)
+        chunk_sizes (list): Tamanhos de chunk (padrão: DEFAULT_CHUNK_SIZES)
+        engines (list): Engines de mycrc (padrão: todos)
+        min_time (float): Tempo mínimo de medição por caso, em segundos
+        file_bench (bool): Inclui crc64_file (grava arquivos temporários)
+        verbose (bool): Imprime cada resultado ao ser medido
+
+    Returns:
+        dict: {'meta': {...}, 'results': [{function, engine, size,
+            chunk_size, calls, seconds, latency_us, mb_per_s}, ...]}
+    """
+    sizes = sizes or DEFAULT_SIZES
+    chunk_sizes = chunk_sizes or DEFAULT_CHUNK_SIZES
+    engines = engines or ENGINES
+
+    results = []
+
+    def add(result):
+        results.append(result)
+        if verbose:
+            print(format_result(result), flush=True)
+
+    for size in sizes:
+        data = os.urandom(size)
+
+        # Referência: zlib.crc32 (implementação em C)
+        add(_result('zlib.crc32', 'zlib', size, None,
+                    *_measure(lambda: zlib.crc32(data), min_time)))
+
+        for engine in engines:
+            for name, func in (('crc32', mycrc.crc32), ('crc64', mycrc.crc64)):
+                add(_result(name, engine, size, None,
+                            *_measure(lambda: func(data, engine), min_time)))
+
+            for chunk_size in chunk_sizes:
+                if chunk_size > size:
+                    continue
+                for name, func, init in (
+                        ('crc32_incremental', mycrc.crc32_incremental, mycrc.CRC32_INIT),
+                        ('crc64_incremental', mycrc.crc64_incremental, mycrc.CRC64_INIT)):
+                    add(_result(name, engine, size, chunk_size, *_measure(
+                        lambda: _feed(func, data, chunk_size, engine, init),
+                        min_time)))
+
+        if file_bench:
+            fd, filepath = tempfile.mkstemp(prefix='mycrcbench_')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                del data
+                for engine in engines:
+                    for chunk_size in chunk_sizes:
+                        add(_result('crc64_file', engine, size, chunk_size,
+                                    *_measure(lambda: mycrc.crc64_file(
+                                        filepath, chunk_size, engine), min_time)))
+            finally:
+                os.remove(filepath)
+
+    meta = {
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'mycrc_version': mycrc.__version__,
+        'min_time': min_time,
+    }
+    return {'meta': meta, 'results': results}
+
+
+def run_key_benchmarks(n_keys: int = 100_000, min_time: float = DEFAULT_MIN_TIME,
+                       verbose: bool = False):
+    """
+    Mede os hashes de chave de 64 bits de myhash sobre n_keys chaves curtas.
+
+    Cada função é medida chave a chave (list comprehension) e em coluna
+    (variante *_column). 'size' é o total de bytes das chaves e
+    'chunk_size' é o número de chaves, para que latency_us seja por lote.
+    Antes da medição, confere que as duas variantes dão os mesmos valores;
+    cada caso é aquecido por _measure (o primeiro uso de NumPy não entra
+    no tempo da coluna).
+
+    Returns:
+        list: Resultados no mesmo formato de run_benchmarks
+
+    Raises:
+        AssertionError: Se a variante em coluna divergir da escalar
+    """
+    keys = [f"cliente-{i:09d}" for i in range(n_keys)]
+    size = sum(len(key) for key in keys)
+
+    results = []
+    for name, scalar, column in KEY_HASHES:
+        sample = keys[:1000]
+        assert column(sample).tolist() == [scalar(key) for key in sample], name
+        for engine, func in (('scalar', lambda: [scalar(key) for key in keys]),
+                             ('column', lambda: column(keys))):
+            result = _result(name, engine, size, n_keys, *_measure(func, min_time))
+            result['ns_per_key'] = result['latency_us'] * 1e3 / n_keys
+            results.append(result)
+            if verbose:
+                print(f"{format_result(result)} {result['ns_per_key']:>9.1f} ns/chave",
+                      flush=True)
+    return results
+
+
+# =============================================================================
+# RESULTADOS
+# =============================================================================
+
+def _key(result):
+    return (result['function'], result['engine'], result['size'],
+            result['chunk_size'])
+
+
+def format_result(result) -> str:
+    """Formata um resultado em uma linha legível."""
+    chunk = f"chunk={result['chunk_size']}" if result['chunk_size'] else ''
+    return (f"{result['function']:<18} {result['engine']:<9} "
+            f"size={result['size']:<11} {chunk:<14} "
+            f"{result['mb_per_s']:>10.2f} MB/s {result['latency_us']:>14.2f} us")
+
+
+def save_results(results: dict, path: str) -> None:
+    """Grava os resultados em JSON."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=1)
+
+
+def load_results(path: str) -> dict:
+    """Carrega resultados gravados por save_results."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare_results(baseline: dict, current: dict, tolerance: float = 0.10):
+    """
+    Compara duas execuções e aponta regressões de throughput.
+
+    Args:
+        baseline (dict): Resultados de referência
+        current (dict): Resultados novos
+        tolerance (float): Queda relativa tolerada (padrão: 10%)
+
+    Returns:
+        list: [(chave, mb_per_s_antes, mb_per_s_agora, variação)] dos casos
+            presentes em ambas as execuções, com variação < -tolerance
+    """
+    before = {_key(r): r['mb_per_s'] for r in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        key = _key(result)
+        if key in before and before[key] > 0:
+            change = result['mb_per_s'] / before[key] - 1
+            if change < -tolerance:
+                regressions.append((key, before[key], result['mb_per_s'], change))
+    return regressions
+
+
+# =============================================================================
+# LINHA DE COMANDO
+# =============================================================================
+
+def _parse_size(text):
+    """Converte '16', '4K', '16M' ou '1G' em bytes."""
+    units = {'K': KiB, 'M': MiB, 'G': GiB}
+    text = text.strip().upper().rstrip('B').rstrip('I')
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=lambda s: [_parse_size(x) for x in s.split(',')],
+                        help="Tamanhos de payload separados por vírgula (ex: 16,4K,1M)")
+    parser.add_argument('--max-size', type=_parse_size,
+                        help="Ignora tamanhos acima deste (ex: 16M)")
+    parser.add_argument('--chunk-sizes', type=lambda s: [_parse_size(x) for x in s.split(',')],
+                        help="Tamanhos de chunk separados por vírgula")
+    parser.add_argument('--engines', type=lambda s: s.split(','),
+                        help=f"Engines separados por vírgula ({','.join(ENGINES)})")
+    parser.add_argument('--min-time', type=float, default=DEFAULT_MIN_TIME)
+    parser.add_argument('--no-file', action='store_true', help="Não mede crc64_file")
+    parser.add_argument('--keys', type=int, default=0,
+                        help="Mede também os hashes de chave de myhash com N chaves")
+    parser.add_argument('--output', help="Grava os resultados em JSON")
+    parser.add_argument('--compare', help="JSON de referência para detectar regressões")
+    parser.add_argument('--tolerance', type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    sizes = args.sizes or DEFAULT_SIZES
+    if args.max_size:
+        sizes = [size for size in sizes if size <= args.max_size]
+
+    results = run_benchmarks(sizes, args.chunk_sizes, args.engines,
+                             args.min_time, not args.no_file, verbose=True)
+    if args.keys:
+        results['results'] += run_key_benchmarks(args.keys, args.min_time,
+                                                 verbose=True)
+    if args.output:
+        save_results(results, args.output)
+
+    if args.compare:
+        regressions = compare_results(load_results(args.compare), results,
+                                      args.tolerance)
+        for key, before, now, change in regressions:
+            print(f"REGRESSÃO {key}: {before:.2f} -> {now:.2f} MB/s ({change:+.1%})")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
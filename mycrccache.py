@@ -0,0 +1,440 @@
+# -*- coding: utf-8 -*-
+"""
+Cache persistente de checksums de arquivos (manifesto em disco).
+
+Evita recalcular o CRC de arquivos que não mudaram entre execuções. Cada
+entrada é identificada por (device, inode) e validada por (size, mtime_ns):
+se o tamanho ou a data de modificação mudarem, o arquivo é recalculado.
+
+Created on Sun Oct 18 2026
+@author: uendelrocha@gmail.com
+
+Formato do arquivo (little-endian, mapeável em memória com mmap):
+    - Cabeçalho (24 bytes): magic b'MYCRCC01', algoritmo (8 bytes), n (uint64)
+    - n registros de 40 bytes ordenados por (device, inode):
+      device, inode, size (uint64), mtime_ns (int64), crc (uint64)
+
+As consultas fazem busca binária diretamente no mmap, sem carregar o
+arquivo inteiro. Novas entradas ficam pendentes em memória e são gravadas
+em flush(): o arquivo é relido e mesclado sob um lock exclusivo e então
+substituído atomicamente (os.replace), de modo que vários processos podem
+compartilhar o mesmo cache.
+
+O compartilhamento entre processos vale apenas em POSIX. No Windows, o
+os.replace falha (PermissionError) enquanto outro processo mantém o arquivo
+mapeado; lá, use um cache por processo.
+
+Example:
+    >>> from my.mycrccache import ChecksumCache, cached_crc64_file
+    >>> with ChecksumCache("checksums.crcc") as cache:
+    ...     for path in arquivos:
+    ...         crc = cache.checksum(path)
+    >>>
+    >>> # Atalho com cache compartilhado no processo (gravado ao sair)
+    >>> crc = cached_crc64_file("documento.pdf", "checksums.crcc")
+"""
+
+import atexit
+import mmap
+import os
+from contextlib import contextmanager
+from struct import Struct
+
+from my import mycrc, myuseful
+
+# =============================================================================
+# CONSTANTES
+# =============================================================================
+
+_MAGIC = b'MYCRCC01'
+_HEADER = Struct('<8s8sQ')       # magic, algoritmo, quantidade de registros
+_RECORD = Struct('<QQQqQ')       # device, inode, size, mtime_ns, crc
+
+# Funções de cálculo suportadas (gravadas no cabeçalho do cache)
+_ALGORITHMS = {
+    'crc64': mycrc.crc64_file,
+    'crc32': mycrc.crc32_file,
+}
+
+# Quantidade de entradas pendentes que dispara um flush automático
+AUTOFLUSH_PENDING = 10000
+
+# Caches abertos por cached_crc64_file (gravados no encerramento do processo)
+_OPEN_CACHES = {}
+
+
+# =============================================================================
+# FUNÇÕES INTERNAS
+# =============================================================================
+
+@contextmanager
+def _file_lock(lock_path):
+    """
+    Lock exclusivo entre processos sobre um arquivo auxiliar.
+
+    Usa fcntl.flock no Linux/macOS e msvcrt.locking no Windows.
+    """
+    with open(lock_path, 'a+b') as f:
+        if os.name == 'nt':
+            import msvcrt
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _stat_key(filepath):
+    """Retorna ((device, inode), size, mtime_ns) de um arquivo."""
+    st = os.stat(filepath)
+    return (st.st_dev, st.st_ino), st.st_size, st.st_mtime_ns
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+class ChecksumCache:
+    """
+    Cache persistente de checksums indexado por (device, inode, size, mtime_ns).
+
+    Args:
+        cache_path (str): Caminho do arquivo de cache (criado no primeiro flush)
+        algorithm (str): 'crc64' ou 'crc32' (padrão: 'crc64')
+        autoflush (int): Grava automaticamente ao acumular esta quantidade de
+            entradas pendentes (padrão: AUTOFLUSH_PENDING; 0 desativa)
+
+    Raises:
+        ValueError: Se o algoritmo não for suportado ou diferir do gravado
+            no arquivo de cache existente
+
+    Note:
+        Use como context manager (ou chame flush()/close()) para gravar as
+        entradas novas. Sem flush, os cálculos feitos não são persistidos.
+    """
+
+    def __init__(self, cache_path: str, algorithm: str = 'crc64',
+                 autoflush: int = AUTOFLUSH_PENDING):
+        if algorithm not in _ALGORITHMS:
+            raise ValueError(
+                f"Algoritmo não suportado: '{algorithm}'. "
+                f"Use {', '.join(_ALGORITHMS)}"
+            )
+
+        self.cache_path = cache_path
+        self.algorithm = algorithm
+        self.autoflush = autoflush
+
+        self._pending = {}    # (device, inode) -> (size, mtime_ns, crc)
+        self._removed = set() # (device, inode) invalidados desde o último flush
+        self._file = None
+        self._mm = None
+        self._count = 0
+        self.reload()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self._count + len(self._pending)
+
+    def __repr__(self):
+        return (f"ChecksumCache('{self.cache_path}', algorithm='{self.algorithm}', "
+                f"entries={self._count}, pending={len(self._pending)})")
+
+    # -------------------------------------------------------------------------
+    # Leitura do arquivo
+    # -------------------------------------------------------------------------
+
+    def _unmap(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._file.close()
+        self._mm = self._file = None
+        self._count = 0
+
+    def reload(self):
+        """Reabre o arquivo de cache (vê as gravações de outros processos)."""
+        self._unmap()
+        if not os.path.isfile(self.cache_path):
+            return
+        if os.path.getsize(self.cache_path) < _HEADER.size:
+            return  # Arquivo vazio ou truncado: tratado como cache vazio
+
+        self._file = open(self.cache_path, 'rb')
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, algorithm, count = _HEADER.unpack_from(self._mm, 0)
+
+        if magic != _MAGIC:
+            self._unmap()
+            raise ValueError(f"Arquivo de cache inválido: {self.cache_path}")
+        algorithm = algorithm.rstrip(b'\0').decode('ascii')
+        if algorithm != self.algorithm:
+            self._unmap()
+            raise ValueError(
+                f"O cache {self.cache_path} contém '{algorithm}', "
+                f"esperado '{self.algorithm}'"
+            )
+
+        self._count = min(count, (len(self._mm) - _HEADER.size) // _RECORD.size)
+
+    def _lookup(self, key):
+        """Busca binária de (device, inode) no mmap; retorna o registro ou None."""
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            record = _RECORD.unpack_from(self._mm, _HEADER.size + mid * _RECORD.size)
+            if record[:2] < key:
+                lo = mid + 1
+            elif record[:2] > key:
+                hi = mid
+            else:
+                return record
+        return None
+
+    def _records(self):
+        """Percorre todos os registros gravados no arquivo."""
+        for i in range(self._count):
+            yield _RECORD.unpack_from(self._mm, _HEADER.size + i * _RECORD.size)
+
+    # -------------------------------------------------------------------------
+    # API pública
+    # -------------------------------------------------------------------------
+
+    def get(self, filepath: str):
+        """
+        Retorna o checksum em cache de um arquivo, se ainda for válido.
+
+        Args:
+            filepath (str): Caminho do arquivo
+
+        Returns:
+            int | None: Checksum em cache ou None se ausente/desatualizado
+
+        Raises:
+            FileNotFoundError: Se o arquivo não existir
+        """
+        key, size, mtime_ns = _stat_key(filepath)
+        return self._get(key, size, mtime_ns)
+
+    def _get(self, key, size, mtime_ns):
+        if key in self._pending:
+            entry = self._pending[key]
+        elif key in self._removed:
+            return None
+        else:
+            record = self._lookup(key)
+            entry = record[2:] if record else None
+
+        if entry and entry[0] == size and entry[1] == mtime_ns:
+            return entry[2]
+        return None
+
+    def checksum(self, filepath: str, **kwargs) -> int:
+        """
+        Retorna o checksum do arquivo, recalculando apenas se ele mudou.
+
+        Args:
+            filepath (str): Caminho do arquivo
+            **kwargs: Repassados a crc64_file/crc32_file (chunk_size,
+                engine, workers)
+
+        Returns:
+            int: Checksum do arquivo
+
+        Raises:
+            FileNotFoundError: Se o arquivo não existir
+            IOError: Se houver erro de leitura do arquivo
+        """
+        key, size, mtime_ns = _stat_key(filepath)
+        crc = self._get(key, size, mtime_ns)
+        if crc is not None:
+            return crc
+
+        crc = _ALGORITHMS[self.algorithm](filepath, **kwargs)
+
+        # Só guarda se o arquivo não mudou durante o cálculo
+        if _stat_key(filepath) == (key, size, mtime_ns):
+            self._pending[key] = (size, mtime_ns, crc)
+            self._removed.discard(key)
+            if self.autoflush and len(self._pending) >= self.autoflush:
+                self.flush()
+
+        return crc
+
+    def invalidate(self, filepath: str) -> None:
+        """
+        Remove a entrada de um arquivo do cache (efetivado no próximo flush).
+
+        Raises:
+            FileNotFoundError: Se o arquivo não existir
+        """
+        key = _stat_key(filepath)[0]
+        self._pending.pop(key, None)
+        self._removed.add(key)
+
+    def prune(self, keep_paths) -> int:
+        """
+        Mantém apenas as entradas dos arquivos informados e grava o cache.
+
+        Como o cache guarda (device, inode) e não caminhos, o chamador
+        informa os arquivos que ainda interessam; as demais entradas
+        (arquivos apagados, renomeados para fora do conjunto etc.) são
+        descartadas. Caminhos inexistentes são ignorados.
+
+        Args:
+            keep_paths: Iterável com os caminhos a manter
+
+        Returns:
+            int: Quantidade de entradas removidas
+        """
+        keep = set()
+        for path in keep_paths:
+            try:
+                keep.add(_stat_key(path)[0])
+            except OSError:
+                pass
+        return self.flush(keep=keep)
+
+    def clear(self) -> None:
+        """Remove todas as entradas do cache (efetivado no próximo flush)."""
+        self._pending.clear()
+        self._removed.update(record[:2] for record in self._records())
+
+    def flush(self, keep=None) -> int:
+        """
+        Grava as entradas pendentes, mesclando com o arquivo atual.
+
+        O arquivo é relido sob lock exclusivo (para não perder entradas
+        gravadas por outros processos), mesclado e substituído atomicamente.
+        Só em POSIX: no Windows, a substituição falha com PermissionError se
+        outro processo estiver com o cache mapeado.
+
+        Args:
+            keep: Conjunto opcional de chaves (device, inode) a manter;
+                as demais são descartadas (usado por prune)
+
+        Returns:
+            int: Quantidade de entradas descartadas por invalidate/prune
+        """
+        if not self._pending and not self._removed and keep is None:
+            return 0
+
+        with _file_lock(self.cache_path + '.lock'):
+            self.reload()
+            entries = {record[:2]: record[2:] for record in self._records()}
+
+            dropped = 0
+            for key in self._removed:
+                dropped += entries.pop(key, None) is not None
+            entries.update(self._pending)
+            if keep is not None:
+                before = len(entries)
+                entries = {k: v for k, v in entries.items() if k in keep}
+                dropped += before - len(entries)
+
+            header = self.algorithm.encode('ascii')
+            self._unmap()
+            with myuseful.atomic_write(self.cache_path) as f:
+                f.write(_HEADER.pack(_MAGIC, header, len(entries)))
+                f.writelines(_RECORD.pack(*key, *entries[key])
+                             for key in sorted(entries))
+
+            self._pending.clear()
+            self._removed.clear()
+            self.reload()
+
+        return dropped
+
+    def close(self) -> None:
+        """Grava as entradas pendentes e libera o mmap."""
+        self.flush()
+        self._unmap()
+
+
+# =============================================================================
+# ATALHOS
+# =============================================================================
+
+def _open_cache(cache_path, algorithm):
+    """Retorna o ChecksumCache compartilhado do processo para cache_path."""
+    key = (os.path.abspath(cache_path), algorithm)
+    cache = _OPEN_CACHES.get(key)
+    if cache is None:
+        cache = _OPEN_CACHES[key] = ChecksumCache(cache_path, algorithm)
+    return cache
+
+
+@atexit.register
+def flush_all() -> None:
+    """Grava todos os caches abertos por cached_crc64_file/cached_crc32_file."""
+    for cache in _OPEN_CACHES.values():
+        cache.flush()
+
+
+def cached_crc64_file(filepath: str, cache_path: str, **kwargs) -> int:
+    """
+    Calcula o CRC-64 de um arquivo usando um cache persistente.
+
+    Arquivos cujo (device, inode, size, mtime_ns) não mudaram desde o
+    último cálculo não são relidos. O cache é compartilhado no processo e
+    gravado automaticamente (a cada AUTOFLUSH_PENDING entradas e ao sair).
+
+    Args:
+        filepath (str): Caminho do arquivo
+        cache_path (str): Caminho do arquivo de cache
+        **kwargs: Repassados a mycrc.crc64_file (chunk_size, engine, workers)
+
+    Returns:
+        int: Valor CRC-64 do arquivo (igual a mycrc.crc64_file)
+    """
+    return _open_cache(cache_path, 'crc64').checksum(filepath, **kwargs)
+
+
+def cached_crc32_file(filepath: str, cache_path: str, **kwargs) -> int:
+    """
+    Calcula o CRC-32 de um arquivo usando um cache persistente.
+
+    Veja cached_crc64_file. O arquivo de cache deve ser distinto do usado
+    para CRC-64.
+    """
+    return _open_cache(cache_path, 'crc32').checksum(filepath, **kwargs)
+
+
+def invalidate_cached_file(filepath: str, cache_path: str,
+                           algorithm: str = 'crc64') -> None:
+    """Remove um arquivo do cache compartilhado (gravado no próximo flush)."""
+    _open_cache(cache_path, algorithm).invalidate(filepath)
+
+
+def prune_cache(cache_path: str, keep_paths, algorithm: str = 'crc64') -> int:
+    """
+    Mantém no cache apenas os arquivos de keep_paths e grava o resultado.
+
+    Returns:
+        int: Quantidade de entradas removidas
+    """
+    return _open_cache(cache_path, algorithm).prune(keep_paths)
+
+
+__all__ = [
+    'ChecksumCache',
+    'AUTOFLUSH_PENDING',
+    'cached_crc64_file',
+    'cached_crc32_file',
+    'invalidate_cached_file',
+    'prune_cache',
+    'flush_all',
+]
@@ -0,0 +1,375 @@
+# -*- coding: utf-8 -*-
+"""
+Deduplicação compacta de fluxos de registros por chaves de 64 bits.
+
+Um set Python de hexdigests md5 custa mais de 100 bytes por entrada. Aqui
+cada registro vira uma chave uint64 (hash_crc64_int64, hash_md5_int64 ou
+hash_blake64_int64, calculadas em lote pelas versões *_column de myhash):
+
+    - BloomFilter: ~1,2 bytes por entrada com 1% de falsos positivos
+      (~9,6 bits * ln(1/p) / ln(100)). "Não visto" é sempre correto; "já
+      visto" erra com a taxa configurada.
+    - SortedKeySet: exato (a menos de colisões de 64 bits, ~n²/2^65),
+      8 bytes por entrada em runs uint64 ordenados, como em uma LSM-tree.
+
+Ambos fazem inserções e consultas em lote com NumPy, são gravados em disco
+em um formato que é aberto com mmap (sem carregar o arquivo) e podem ser
+mesclados, para juntar os resultados de workers paralelos.
+
+Created on Sun Oct 18 2026
+@author: uendelrocha@gmail.com
+
+Formatos (little-endian):
+    - BloomFilter: magic b'MYBLOOM1', algoritmo (8s), m bits (uint64),
+      k (uint64), inserções (uint64) + m/8 bytes de bits
+    - SortedKeySet: magic b'MYKEYS01', algoritmo (8s), n (uint64) +
+      n chaves uint64 ordenadas
+
+Example:
+    >>> from my.mydedup import BloomFilter
+    >>> seen = BloomFilter(capacity=500_000_000, fp_rate=0.001)
+    >>> for lote in lotes:
+    ...     novos = lote[seen.add(lote['registro'])]
+    >>> seen.save("vistos.bloom")
+"""
+
+import math
+from struct import Struct
+
+from my import myhash, myuseful
+
+# =============================================================================
+# CONSTANTES
+# =============================================================================
+
+_BLOOM_MAGIC = b'MYBLOOM1'
+_BLOOM_HEADER = Struct('<8s8sQQQ')   # magic, algoritmo, m, k, inserções
+
+_KEYS_MAGIC = b'MYKEYS01'
+_KEYS_HEADER = Struct('<8s8sQ')      # magic, algoritmo, n
+
+# Bytes do filtro por bloco na contagem de bits ligados (limita temporários)
+_POPCOUNT_CHUNK = 16 * 1024 * 1024
+
+# Hash vetorizado de strings para uint64
+KEY_ALGORITHMS = {
+    'crc64': myhash.hash_crc64_int64_column,
+    'md5': myhash.hash_md5_int64_column,
+    'blake64': myhash.hash_blake64_int64_column,
+}
+
+
+# =============================================================================
+# FUNÇÕES INTERNAS
+# =============================================================================
+
+def _check_algorithm(algorithm):
+    if algorithm not in KEY_ALGORITHMS:
+        raise ValueError(f"Algoritmo '{algorithm}' não suportado. "
+                         f"Use: {', '.join(KEY_ALGORITHMS)}")
+
+
+def _hash_values(values, algorithm, encoding):
+    """Converte uma string ou coleção de strings em array uint64."""
+    if isinstance(values, str):
+        values = [values]
+    return KEY_ALGORITHMS[algorithm](values, encoding)
+
+
+def _first_occurrences(keys):
+    """Máscara das primeiras ocorrências de cada chave dentro do lote."""
+    import numpy as np  # pip install numpy
+    mask = np.zeros(len(keys), dtype=bool)
+    mask[np.unique(keys, return_index=True)[1]] = True
+    return mask
+
+
+def _read_header(path, header, magic):
+    with open(path, 'rb') as f:
+        fields = header.unpack(f.read(header.size))
+    if fields[0] != magic:
+        raise ValueError(f"Arquivo inválido: {path}")
+    return fields[1].rstrip(b'\0').decode('ascii'), fields[2:]
+
+
+def _write_file(path, header_bytes, arrays):
+    with myuseful.atomic_write(path) as f:
+        f.write(header_bytes)
+        for array in arrays:
+            array.tofile(f)
+
+
+def optimal_bloom_parameters(capacity: int, fp_rate: float):
+    """
+    Tamanho (bits, múltiplo de 64) e número de hashes de um Bloom filter.
+
+    Returns:
+        tuple: (m, k) com m = -n ln(p) / ln(2)² e k = (m / n) ln(2)
+    """
+    if capacity < 1 or not 0 < fp_rate < 1:
+        raise ValueError("capacity deve ser positivo e 0 < fp_rate < 1")
+    m = math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2)
+    m = -(-m // 64) * 64
+    k = max(1, round(m / capacity * math.log(2)))
+    return m, k
+
+
+# =============================================================================
+# BLOOM FILTER
+# =============================================================================
+
+class BloomFilter:
+    """
+    Bloom filter sobre chaves de 64 bits, com double hashing
+    (h1 + i * h2, h2 derivado de h1 pelo finalizador do splitmix64).
+
+    Args:
+        capacity (int): Quantidade esperada de entradas distintas
+        fp_rate (float): Taxa de falsos positivos na capacidade (padrão: 1%)
+        algorithm (str): Hash das strings: 'crc64' (padrão), 'md5' ou 'blake64'
+        encoding (str): Codificação das strings (padrão: 'utf-8')
+
+    Example:
+        >>> seen = BloomFilter(1_000_000, 0.001)
+        >>> novos = seen.add(["a", "b", "a"])   # [True, True, False]
+        >>> "a" in seen
+        True
+    """
+
+    def __init__(self, capacity: int = 1_000_000, fp_rate: float = 0.01,
+                 algorithm: str = 'crc64', encoding='utf-8'):
+        import numpy as np  # pip install numpy
+        _check_algorithm(algorithm)
+        self.m, self.k = optimal_bloom_parameters(capacity, fp_rate)
+        self.algorithm = algorithm
+        self.encoding = encoding
+        self.inserted = 0  # Chaves novas inseridas (estimativa)
+        self.bits = np.zeros(self.m // 8, dtype=np.uint8)
+
+    def __len__(self):
+        return self.inserted
+
+    def __contains__(self, value):
+        return bool(self.contains(value)[0])
+
+    def _positions(self, keys):
+        """Array (k, n) com as posições dos bits de cada chave."""
+        import numpy as np  # pip install numpy
+        h1 = np.asarray(keys, dtype=np.uint64)
+        h2 = myhash.splitmix64(h1) | np.uint64(1)
+        steps = np.arange(self.k, dtype=np.uint64)[:, None]
+        return (h1 + steps * h2) % np.uint64(self.m)
+
+    def _test(self, positions):
+        import numpy as np  # pip install numpy
+        bits = (self.bits[positions >> np.uint64(3)]
+                >> (positions & np.uint64(7)).astype(np.uint8)) & 1
+        return bits.all(axis=0)
+
+    def contains_hashes(self, keys):
+        """Consulta em lote de chaves uint64 já calculadas (array bool)."""
+        return self._test(self._positions(keys))
+
+    def add_hashes(self, keys):
+        """
+        Insere chaves uint64 já calculadas.
+
+        Returns:
+            numpy.ndarray: Máscara bool das chaves novas (não vistas antes nem
+                repetidas antes dentro do lote), exceto falsos positivos
+        """
+        import numpy as np  # pip install numpy
+        positions = self._positions(keys)
+        new = ~self._test(positions) & _first_occurrences(np.asarray(keys, dtype=np.uint64))
+        positions = positions.ravel()
+        np.bitwise_or.at(self.bits, positions >> np.uint64(3),
+                         np.left_shift(np.uint8(1), (positions & np.uint64(7)).astype(np.uint8)))
+        self.inserted += int(np.count_nonzero(new))
+        return new
+
+    def contains(self, values):
+        """Consulta em lote de strings (str, lista, Series...): array bool."""
+        return self.contains_hashes(_hash_values(values, self.algorithm, self.encoding))
+
+    def add(self, values):
+        """Insere strings em lote. Retorna a máscara das novas (veja add_hashes)."""
+        return self.add_hashes(_hash_values(values, self.algorithm, self.encoding))
+
+    def estimated_fp_rate(self) -> float:
+        """Taxa de falsos positivos estimada pela fração de bits ligados."""
+        import numpy as np  # pip install numpy
+        if hasattr(np, 'bitwise_count'):  # NumPy >= 2.0
+            popcount = np.bitwise_count
+        else:
+            popcount = np.array([bin(i).count('1') for i in range(256)],
+                                dtype=np.uint8).take
+        ones = 0
+        for start in range(0, len(self.bits), _POPCOUNT_CHUNK):
+            chunk = self.bits[start:start + _POPCOUNT_CHUNK]
+            ones += int(popcount(chunk).sum(dtype=np.uint64))
+        return (ones / self.m) ** self.k
+
+    def merge(self, other: 'BloomFilter') -> 'BloomFilter':
+        """
+        Incorpora outro filtro (OR dos bits), ex: de um worker paralelo.
+
+        Raises:
+            ValueError: Se os filtros tiverem parâmetros diferentes
+        """
+        if (self.m, self.k, self.algorithm) != (other.m, other.k, other.algorithm):
+            raise ValueError("Os filtros devem ter mesmos m, k e algoritmo")
+        self.bits |= other.bits
+        self.inserted += other.inserted  # Limite superior (pode contar repetidos)
+        return self
+
+    def save(self, path: str) -> None:
+        """Grava o filtro (cabeçalho + bits) em path."""
+        header = _BLOOM_HEADER.pack(_BLOOM_MAGIC, self.algorithm.encode('ascii'),
+                                    self.m, self.k, self.inserted)
+        _write_file(path, header, [self.bits])
+
+    @classmethod
+    def load(cls, path: str, mode: str = 'r', encoding='utf-8') -> 'BloomFilter':
+        """
+        Abre um filtro gravado por save com mmap (os bits não são copiados).
+
+        Args:
+            path (str): Arquivo do filtro
+            mode (str): 'r' (somente leitura), 'r+' (inserções gravadas no
+                arquivo) ou 'c' (inserções apenas em memória)
+        """
+        import numpy as np  # pip install numpy
+        algorithm, (m, k, inserted) = _read_header(path, _BLOOM_HEADER, _BLOOM_MAGIC)
+        bloom = cls.__new__(cls)
+        bloom.m, bloom.k = m, k
+        bloom.algorithm = algorithm
+        bloom.encoding = encoding
+        bloom.inserted = inserted
+        bloom.bits = np.memmap(path, dtype=np.uint8, mode=mode,
+                               offset=_BLOOM_HEADER.size, shape=(m // 8,))
+        return bloom
+
+
+# =============================================================================
+# CONJUNTO EXATO DE CHAVES (uint64 ordenados)
+# =============================================================================
+
+class SortedKeySet:
+    """
+    Conjunto exato de chaves uint64 em runs ordenados.
+
+    Cada lote novo vira um run; runs de tamanhos parecidos são intercalados,
+    de modo que há no máximo ~log2(n) runs e cada chave é regravada
+    O(log n) vezes. Consultas fazem busca binária em cada run.
+
+    Args:
+        algorithm (str): Hash das strings: 'crc64' (padrão), 'md5' ou 'blake64'
+        encoding (str): Codificação das strings (padrão: 'utf-8')
+
+    Example:
+        >>> seen = SortedKeySet('md5')
+        >>> novos = seen.add(df['registro'])
+        >>> df_novos = df[novos]
+    """
+
+    def __init__(self, algorithm: str = 'crc64', encoding='utf-8'):
+        _check_algorithm(algorithm)
+        self.algorithm = algorithm
+        self.encoding = encoding
+        self._runs = []  # Arrays uint64 ordenados, do maior para o menor
+
+    def __len__(self):
+        return sum(len(run) for run in self._runs)
+
+    def __contains__(self, value):
+        return bool(self.contains(value)[0])
+
+    def contains_hashes(self, keys):
+        """Consulta em lote de chaves uint64 já calculadas (array bool)."""
+        import numpy as np  # pip install numpy
+        keys = np.asarray(keys, dtype=np.uint64)
+        found = np.zeros(len(keys), dtype=bool)
+        for run in self._runs:
+            pos = np.searchsorted(run, keys)
+            pos[pos == len(run)] = 0
+            found |= run[pos] == keys
+        return found
+
+    def _push(self, run):
+        import numpy as np  # pip install numpy
+        self._runs.append(run)
+        while len(self._runs) > 1 and len(self._runs[-2]) <= 2 * len(self._runs[-1]):
+            last = self._runs.pop()
+            self._runs[-1] = np.union1d(self._runs[-1], last)
+
+    def add_hashes(self, keys):
+        """
+        Insere chaves uint64 já calculadas.
+
+        Returns:
+            numpy.ndarray: Máscara bool das chaves novas (não vistas antes nem
+                repetidas antes dentro do lote)
+        """
+        import numpy as np  # pip install numpy
+        keys = np.asarray(keys, dtype=np.uint64)
+        new = ~self.contains_hashes(keys) & _first_occurrences(keys)
+        if new.any():
+            self._push(np.sort(keys[new]))
+        return new
+
+    def contains(self, values):
+        """Consulta em lote de strings (str, lista, Series...): array bool."""
+        return self.contains_hashes(_hash_values(values, self.algorithm, self.encoding))
+
+    def add(self, values):
+        """Insere strings em lote. Retorna a máscara das novas."""
+        return self.add_hashes(_hash_values(values, self.algorithm, self.encoding))
+
+    def keys(self):
+        """Todas as chaves em um único array uint64 ordenado (intercala os runs)."""
+        import numpy as np  # pip install numpy
+        if len(self._runs) > 1:
+            self._runs = [np.unique(np.concatenate(self._runs))]
+        return self._runs[0] if self._runs else np.empty(0, dtype=np.uint64)
+
+    def merge(self, other: 'SortedKeySet') -> 'SortedKeySet':
+        """
+        Incorpora outro conjunto (união), ex: de um worker paralelo.
+
+        Raises:
+            ValueError: Se os algoritmos forem diferentes
+        """
+        if self.algorithm != other.algorithm:
+            raise ValueError("Os conjuntos devem usar o mesmo algoritmo")
+        for run in other._runs:
+            self.add_hashes(run)
+        return self
+
+    def save(self, path: str) -> None:
+        """Grava as chaves ordenadas (cabeçalho + array uint64) em path."""
+        keys = self.keys()
+        header = _KEYS_HEADER.pack(_KEYS_MAGIC, self.algorithm.encode('ascii'),
+                                   len(keys))
+        _write_file(path, header, [keys.astype('<u8', copy=False)])
+
+    @classmethod
+    def load(cls, path: str, encoding='utf-8') -> 'SortedKeySet':
+        """
+        Abre um conjunto gravado por save com mmap (somente leitura). Novas
+        chaves ficam em memória, em runs menores sobre o run mapeado.
+        """
+        import numpy as np  # pip install numpy
+        algorithm, (n,) = _read_header(path, _KEYS_HEADER, _KEYS_MAGIC)
+        keyset = cls(algorithm, encoding)
+        if n:
+            keyset._runs.append(np.memmap(path, dtype='<u8', mode='r',
+                                          offset=_KEYS_HEADER.size, shape=(n,)))
+        return keyset
+
+
+__all__ = [
+    'KEY_ALGORITHMS',
+    'optimal_bloom_parameters',
+    'BloomFilter',
+    'SortedKeySet',
+]
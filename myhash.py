@@ -15,10 +15,24 @@ Licença: MIT
 # from binascii import crc32 # Apenas um wrapper para zlib.crc32
 # from zlib import crc32
 from my import mycrc
-from hashlib import sha1 as sha160, sha256, sha512, md5
+from hashlib import sha1 as sha160, sha256, sha512, md5, blake2b
+from functools import partial
 from enum import Enum
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+import asyncio
+import inspect
+import logging
+import os
+import sys
+import threading
+from collections import OrderedDict
+import tarfile
+import zipfile
 
 #%% CONSTANTS
+# Tamanho padrão do buffer de leitura das funções de arquivo
+CHUNK_SIZE = 1024 * 1024  # 1MB
+
 class OutputFormat(Enum):
     """Formatos de saída para hash CRC32 e CRC64.
     
@@ -113,6 +127,45 @@ def hash_crc64_str(s: str) -> str:
     """Retorna CRC64 como string hexadecimal (16 chars)"""
     return hash_crc64(s, OutputFormat.str64)
 
+#%% Hash de 64 bits para chaves (BLAKE2b com digest de 8 bytes)
+# Alternativa a hash_md5_int64 para partition/bucket IDs: o BLAKE2b faz
+# parte do hashlib (sem extensões compiladas) e, com digest_size=8, o inteiro
+# sai direto dos 8 bytes, sem hexdigest. Por chave, o custo é dominado pela
+# chamada Python e fica próximo ao do MD5; para colunas, use
+# hash_blake64_int64_column (ver mycrcbench --keys).
+# Não é compatível com hash_md5_int64 (chaves diferentes para a mesma entrada).
+def hash_blake64(s: str, out_format: OutputFormat = OutputFormat.hex64, encoding = 'utf-8'):
+    """
+    Calcula BLAKE2b-64 de uma string e retorna no formato especificado.
+
+    Args:
+        s: String de entrada
+        out_format: Formato de saída (padrão: hex64)
+        encoding: Codificação da string (padrão: 'utf-8')
+
+    Returns:
+        BLAKE2b-64 formatado conforme out_format
+
+    Example:
+        >>> hash_blake64("123456", OutputFormat.int64) == int(
+        ...     blake2b(b"123456", digest_size=8).hexdigest(), 16)
+        True
+    """
+    digest = blake2b(s.encode(encoding), digest_size=8).digest()
+    return out_format(int.from_bytes(digest, 'big'))
+
+def hash_blake64_hex(s: str) -> str:
+    """Retorna BLAKE2b-64 como '0xXXXXXXXXXXXXXXXX'"""
+    return hash_blake64(s, OutputFormat.hex64)
+
+def hash_blake64_int64(s: str, encoding = 'utf-8') -> int:
+    """Retorna BLAKE2b-64 como inteiro uint64"""
+    return int.from_bytes(blake2b(s.encode(encoding), digest_size=8).digest(), 'big')
+
+def hash_blake64_str(s: str) -> str:
+    """Retorna BLAKE2b-64 como string hexadecimal (16 chars)"""
+    return hash_blake64(s, OutputFormat.str64)
+
 #%% Calcula hashes de um arquivo (colisões conhecidas 1/2^32)
 # Este hash NÃO deve ser usado para guardar senhas
 def crc_file(file_path):
@@ -179,4 +232,945 @@ def sha512_str(s:str, encoding = 'utf-8'):
 
 # Alias sha3 para sha512
 def sha3(s:str, encoding = 'utf-8'):
-  return sha512_str(s, encoding)
\ No newline at end of file
+  return sha512_str(s, encoding)
+
+
+#%% Hashers em streaming (interface do hashlib: update/digest/hexdigest/copy)
+# Permite tratar crc32/crc64 da mesma forma que md5/sha256 em pipelines
+HASH_ALGORITHMS = {
+    'crc32': mycrc.CRC32,
+    'crc64': mycrc.CRC64,
+    'md5': md5,
+    'sha1': sha160,
+    'sha256': sha256,
+    'sha512': sha512,
+    'blake64': partial(blake2b, digest_size=8),
+}
+
+def new_hasher(algorithm: str, data: bytes = b''):
+    """
+    Cria um hasher em streaming pelo nome do algoritmo (como hashlib.new).
+
+    Args:
+        algorithm: Nome do algoritmo (chave de HASH_ALGORITHMS)
+        data: Dados iniciais (opcional)
+
+    Returns:
+        Objeto com update(), digest(), hexdigest() e copy()
+
+    Raises:
+        ValueError: Se o algoritmo não estiver registrado
+
+    Example:
+        >>> h = new_hasher('crc64')
+        >>> h.update(b"123456")
+        >>> h.hexdigest() == mycrc.crc64_hex(b"123456")
+        True
+        >>> new_hasher('md5', b"123456").hexdigest() == md5_str("123456")
+        True
+    """
+    try:
+        constructor = HASH_ALGORITHMS[algorithm.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Algoritmo desconhecido: '{algorithm}'. "
+            f"Disponíveis: {', '.join(HASH_ALGORITHMS)}"
+        ) from None
+    return constructor(data)
+
+#%% Hash de arquivos (md5, sha256...) e API assíncrona
+# Executor padrão da API assíncrona (lazy). O hashlib libera o GIL em
+# buffers grandes, então threads aproveitam vários núcleos.
+_ASYNC_EXECUTOR = None
+
+def _async_executor():
+    global _ASYNC_EXECUTOR
+    if _ASYNC_EXECUTOR is None:
+        _ASYNC_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count())
+    return _ASYNC_EXECUTOR
+
+def hexdigest_file(file_path: str, algorithm: str = 'sha256',
+                   chunk_size: int = CHUNK_SIZE) -> str:
+    """
+    Calcula o hexdigest de um arquivo reutilizando um único buffer.
+
+    Args:
+        file_path: Caminho do arquivo
+        algorithm: Nome do algoritmo (chave de HASH_ALGORITHMS, padrão: sha256)
+        chunk_size: Tamanho do buffer de leitura (padrão: CHUNK_SIZE)
+
+    Example:
+        >>> hexdigest_file("upload.bin", 'crc64')
+    """
+    hasher = new_hasher(algorithm)
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(file_path, 'rb', buffering=0) as f:
+        while n := f.readinto(buffer):
+            hasher.update(view[:n])
+    return hasher.hexdigest()
+
+async def ahash_file(file_path: str, algorithm: str = 'sha256',
+                     chunk_size: int = CHUNK_SIZE, executor=None) -> str:
+    """
+    Calcula o hash de um arquivo sem bloquear o event loop.
+
+    Args:
+        file_path: Caminho do arquivo
+        algorithm: Nome do algoritmo (chave de HASH_ALGORITHMS, padrão: sha256)
+        chunk_size: Tamanho do buffer de leitura (padrão: 1MB)
+        executor: concurrent.futures.Executor a usar (padrão: pool de threads)
+
+    Returns:
+        Hexdigest do arquivo
+
+    Example:
+        >>> digest = await ahash_file("upload.bin", 'md5')
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor or _async_executor(),
+                                      hexdigest_file, file_path, algorithm,
+                                      chunk_size)
+
+async def amd5_file(file_path: str, **kwargs) -> str:
+    """Retorna o md5 (hexdigest) de um arquivo de forma assíncrona."""
+    return await ahash_file(file_path, 'md5', **kwargs)
+
+async def asha256_file(file_path: str, **kwargs) -> str:
+    """Retorna o sha256 (hexdigest) de um arquivo de forma assíncrona."""
+    return await ahash_file(file_path, 'sha256', **kwargs)
+
+def ahash_files(paths, algorithm: str = 'sha256',
+                concurrency: int = mycrc.ASYNC_CONCURRENCY, **kwargs):
+    """
+    Calcula o hash de muitos arquivos de forma assíncrona.
+
+    Args:
+        paths: Iterável de caminhos
+        algorithm: Nome do algoritmo (padrão: sha256)
+        concurrency: Máximo de arquivos simultâneos (padrão: 8)
+        **kwargs: Repassados a ahash_file (chunk_size, executor)
+
+    Returns:
+        Async iterator de (path, hexdigest) em ordem de conclusão
+
+    Example:
+        >>> async for path, digest in ahash_files(uploads, 'md5'):
+        ...     print(path, digest)
+    """
+    return mycrc.afiles(ahash_file, paths, concurrency, algorithm=algorithm, **kwargs)
+
+#%% Hash de membros de arquivos tar/zip sem extração
+def _feed_hashers(f, hashers, buffer):
+    """Lê f até o fim com um buffer reutilizado, alimentando todos os hashers.
+    Retorna a quantidade de bytes lidos."""
+    view = memoryview(buffer)
+    total = 0
+    while n := f.readinto(buffer):
+        chunk = view[:n]
+        for hasher in hashers:
+            hasher.update(chunk)
+        total += n
+    return total
+
+def hash_archive(archive, chunk_size: int = CHUNK_SIZE):
+    """
+    Calcula CRC-64 e SHA-256 de cada arquivo dentro de um tar/tar.gz/zip.
+
+    Os membros são lidos direto do arquivo compactado, sem extração para
+    disco e com memória constante (um único buffer de chunk_size bytes).
+    Arquivos tar (inclusive .gz/.bz2/.xz) são lidos em modo stream, o que
+    permite passar também streams não posicionáveis (ex: uploads).
+
+    Args:
+        archive: Caminho do arquivo ou objeto binário (zip exige seek())
+        chunk_size: Tamanho do buffer de leitura (padrão: 1MB)
+
+    Yields:
+        tuple: (nome do membro, tamanho, crc64 (int), sha256 (hexdigest))
+
+    Raises:
+        tarfile.TarError: Se não for um zip nem um tar válido
+
+    Example:
+        >>> for name, size, crc, digest in hash_archive("lote.tar.gz"):
+        ...     print(name, size, f"{crc:016x}", digest)
+    """
+    buffer = bytearray(chunk_size)
+
+    # Streams não posicionáveis (pipes, sockets) só podem ser tar: is_zipfile()
+    # e seek() exigem acesso aleatório
+    is_stream = hasattr(archive, 'read')
+    if not is_stream or archive.seekable():
+        is_zip = zipfile.is_zipfile(archive)
+        if is_stream:
+            archive.seek(0)  # is_zipfile() avança a posição de streams
+    else:
+        is_zip = False
+
+    if is_zip:
+        with zipfile.ZipFile(archive) as zf:
+            for info in zf.infolist():
+                if info.is_dir():
+                    continue
+                crc, digest = mycrc.CRC64(), sha256()
+                with zf.open(info) as f:
+                    size = _feed_hashers(f, (crc, digest), buffer)
+                yield info.filename, size, crc.intdigest(), digest.hexdigest()
+        return
+
+    if is_stream:
+        tf = tarfile.open(fileobj=archive, mode='r|*')
+    else:
+        tf = tarfile.open(archive, mode='r|*')
+
+    with tf:
+        for member in tf:
+            if not member.isfile():
+                continue
+            crc, digest = mycrc.CRC64(), sha256()
+            with tf.extractfile(member) as f:
+                size = _feed_hashers(f, (crc, digest), buffer)
+            yield member.name, size, crc.intdigest(), digest.hexdigest()
+
+#%% Vários hashes de um arquivo em uma única leitura
+# Formato padrão dos CRCs (mesmo padrão de hash_crc32/hash_crc64)
+_DEFAULT_FORMATS = {
+    'crc32': OutputFormat.hex32,
+    'crc64': OutputFormat.hex64,
+}
+
+def hash_file(file_path: str, algorithms=('crc32', 'crc64', 'md5', 'sha256'),
+              formats: dict = None, chunk_size: int = CHUNK_SIZE) -> dict:
+    """
+    Calcula vários hashes de um arquivo lendo-o uma única vez.
+
+    Cada bloco lido (em um buffer reutilizado) alimenta todos os hashers,
+    então pedir CRC32, CRC64, MD5 e SHA-256 custa uma leitura, não quatro.
+
+    Args:
+        file_path: Caminho do arquivo
+        algorithms: Algoritmos desejados (chaves de HASH_ALGORITHMS)
+        formats: OutputFormat por algoritmo CRC (padrão: hex32 para crc32,
+            hex64 para crc64). Os demais retornam o hexdigest.
+        chunk_size: Tamanho do buffer de leitura (padrão: 1MB)
+
+    Returns:
+        dict: {algoritmo: valor formatado}
+
+    Raises:
+        ValueError: Se um algoritmo não estiver registrado ou se houver
+            formato para um algoritmo que não seja CRC
+
+    Example:
+        >>> hash_file("documento.pdf", ['crc32', 'sha256'])
+        {'crc32': '0x4a17b156', 'sha256': 'a591a6d4...'}
+        >>> hash_file("documento.pdf", ['crc64'], {'crc64': OutputFormat.int64})
+        {'crc64': 13827403126148551023}
+    """
+    formats = {**_DEFAULT_FORMATS, **(formats or {})}
+    for algorithm in formats.keys() - _DEFAULT_FORMATS.keys():
+        raise ValueError(f"OutputFormat só se aplica a crc32/crc64, recebido '{algorithm}'")
+
+    hashers = {algorithm: new_hasher(algorithm) for algorithm in algorithms}
+    with open(file_path, 'rb', buffering=0) as f:
+        _feed_hashers(f, hashers.values(), bytearray(chunk_size))
+
+    return {
+        algorithm: (formats[algorithm](hasher.intdigest())
+                    if algorithm in formats else hasher.hexdigest())
+        for algorithm, hasher in hashers.items()
+    }
+
+#%% Hash de muitos arquivos em paralelo (pool de threads)
+def hash_files(paths, algorithm: str = 'sha256', workers: int = None,
+               chunk_size: int = CHUNK_SIZE, on_error=None):
+    """
+    Calcula o hash de muitos arquivos em paralelo com um pool de threads.
+
+    O hashlib libera o GIL em buffers grandes, então as threads ocupam
+    vários núcleos. No máximo 2 * workers arquivos ficam em processamento
+    ao mesmo tempo, o que limita a memória a cerca de 2 * workers * chunk_size
+    mesmo para listas enormes de caminhos.
+
+    Args:
+        paths: Iterável de caminhos
+        algorithm: Nome do algoritmo (chave de HASH_ALGORITHMS, padrão: sha256)
+        workers: Quantidade de threads (padrão: os.cpu_count())
+        chunk_size: Tamanho do buffer de leitura por arquivo (padrão: 1MB)
+        on_error: Função on_error(path, exception) chamada para cada arquivo
+            com erro (padrão: registra um warning no logging)
+
+    Yields:
+        tuple: (path, hexdigest) em ordem de conclusão; hexdigest é None
+            para arquivos com erro, que não interrompem o lote
+
+    Raises:
+        ValueError: Se o algoritmo não estiver registrado
+
+    Example:
+        >>> for path, digest in hash_files(arquivos, 'md5', workers=8):
+        ...     print(path, digest)
+    """
+    new_hasher(algorithm)  # Valida o algoritmo antes de iniciar o pool
+    workers = workers or os.cpu_count()
+    if on_error is None:
+        on_error = lambda path, e: logging.warning(f"Erro ao calcular hash de {path}: {e}")
+
+    paths = iter(paths)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {}
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < 2 * workers:
+                path = next(paths, pending)  # pending como sentinela
+                if path is pending:
+                    exhausted = True
+                else:
+                    future = executor.submit(hexdigest_file, path, algorithm, chunk_size)
+                    pending[future] = path
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = pending.pop(future)
+                try:
+                    digest = future.result()
+                except Exception as e:
+                    on_error(path, e)
+                    digest = None
+                yield path, digest
+
+#%% Hash vetorizado de colunas (pandas Series / arrays NumPy) -> uint64/uint32
+# Evita, por linha, a chamada via Series.apply, o hexdigest() e o parse
+# int(hex[:16], 16): o inteiro vem direto dos bytes do digest (big-endian,
+# mesmo valor de hash_md5_int64/hash_md5_int32) e o array é montado de uma vez.
+def _md5_prefix_column(values, encoding, nbytes):
+    import numpy as np  # pip install numpy
+    data = b''.join([md5(s.encode(encoding)).digest()[:nbytes] for s in values])
+    return np.frombuffer(data, dtype=f'>u{nbytes}').astype(f'u{nbytes}')
+
+def _crc64_column(values, encoding):
+    return mycrc.crc64_many([s.encode(encoding) for s in values])
+
+def _crc32_column(values, encoding):
+    return mycrc.crc32_many([s.encode(encoding) for s in values])
+
+def _map_column(func, values, workers, *args):
+    """Aplica func à coluna inteira ou, com workers > 1, a partes da coluna
+    em um pool de processos, concatenando os arrays na ordem original."""
+    import numpy as np  # pip install numpy
+    values = list(values)
+    if workers <= 1 or len(values) < 2 * workers:
+        return func(values, *args)
+
+    size = -(-len(values) // workers)
+    parts = [values[i:i + size] for i in range(0, len(values), size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(func, parts, *([arg] * len(parts) for arg in args))
+        return np.concatenate(list(results))
+
+def hash_md5_int64_column(values, encoding = 'utf-8', workers: int = 1):
+    """
+    Versão vetorizada de hash_md5_int64 para uma coluna de strings.
+
+    Args:
+        values: Series, array ou lista de strings
+        encoding: Codificação das strings (padrão: 'utf-8')
+        workers: Processos para colunas muito grandes (padrão: 1 = sem pool)
+
+    Returns:
+        numpy.ndarray: Array uint64, na mesma ordem de values
+
+    Example:
+        >>> df['key'] = hash_md5_int64_column(df['codigo'])
+        >>> hash_md5_int64_column(["123456"])[0] == hash_md5_int64("123456")
+        True
+    """
+    return _map_column(_md5_prefix_column, values, workers, encoding, 8)
+
+def hash_md5_int32_column(values, encoding = 'utf-8', workers: int = 1):
+    """Versão vetorizada de hash_md5_int32 (array uint32). Veja hash_md5_int64_column."""
+    return _map_column(_md5_prefix_column, values, workers, encoding, 4)
+
+def hash_crc64_int64_column(values, encoding = 'utf-8', workers: int = 1):
+    """
+    Versão vetorizada de hash_crc64_int64 (array uint64), via mycrc.crc64_many.
+
+    Example:
+        >>> hash_crc64_int64_column(["123456"])[0] == hash_crc64_int64("123456")
+        True
+    """
+    return _map_column(_crc64_column, values, workers, encoding)
+
+def hash_crc32_int32_column(values, encoding = 'utf-8', workers: int = 1):
+    """Versão vetorizada de hash_crc32_int32 (array uint32), via mycrc.crc32_many."""
+    return _map_column(_crc32_column, values, workers, encoding)
+
+#%% Auditoria de colisões em chaves md5 truncadas (int64/int32)
+class KeyCollisionAuditor:
+    """
+    Gera chaves hash_md5_int64/hash_md5_int32 detectando colisões.
+
+    Cada entrada distinta ocupa 16 bytes (int64) ou 12 bytes (int32): a
+    chave, um verificador de 32 bits tirado do fim do md5 (distingue uma
+    entrada repetida de uma colisão real) e o número da linha (uint32).
+    As chaves ficam em runs ordenados (arrays NumPy, como em uma LSM-tree):
+    cada lote é comparado por busca binária e os runs são intercalados
+    quando atingem tamanhos parecidos, sem dicionários Python por chave.
+
+    Args:
+        bits: 64 (hash_md5_int64) ou 32 (hash_md5_int32)
+        encoding: Codificação das strings (padrão: 'utf-8')
+
+    Raises:
+        ValueError: Se bits não for 32 nem 64
+
+    Example:
+        >>> auditor = KeyCollisionAuditor(bits=32)
+        >>> for lote in lotes:
+        ...     df_lote['key'] = auditor.add(df_lote['codigo'])
+        >>> auditor.report()['collision_rate']
+    """
+
+    def __init__(self, bits: int = 64, encoding = 'utf-8'):
+        if bits not in (32, 64):
+            raise ValueError(f"bits deve ser 32 ou 64, recebido {bits}")
+        self.bits = bits
+        self.encoding = encoding
+        self.rows = 0         # Linhas processadas
+        self.collisions = {}  # chave -> {linha: entrada (None se desconhecida)}
+        self._runs = []       # [(chaves, verificadores, linhas)] ordenados
+
+    def __len__(self):
+        """Quantidade de entradas distintas vistas."""
+        return sum(len(keys) for keys, _, _ in self._runs)
+
+    def _digests(self, values):
+        import numpy as np  # pip install numpy
+        nbytes = self.bits // 8
+        data = b''.join([md5(s.encode(self.encoding)).digest() for s in values])
+        layout = np.dtype({'names': ['key', 'check'],
+                           'formats': [f'>u{nbytes}', '>u4'],
+                           'offsets': [0, 12], 'itemsize': 16})
+        digests = np.frombuffer(data, dtype=layout)
+        return digests['key'].astype(f'u{nbytes}'), digests['check'].astype('u4')
+
+    def _collide(self, key, rows, inputs):
+        entries = self.collisions.setdefault(int(key), {})
+        for row, value in zip(rows, inputs):
+            if entries.get(int(row)) is None:
+                entries[int(row)] = value
+
+    def add(self, values):
+        """
+        Gera as chaves de um lote (Series, array, lista ou iterável de strings).
+
+        Returns:
+            numpy.ndarray: Chaves uint64/uint32 na ordem de values, iguais
+                às de hash_md5_int64/hash_md5_int32
+
+        Raises:
+            OverflowError: Acima de 2^32 linhas (limite do índice uint32)
+        """
+        import numpy as np  # pip install numpy
+        values = list(values)
+        start = self.rows
+        if start + len(values) > 2**32:
+            raise OverflowError("KeyCollisionAuditor suporta até 2^32 linhas")
+        self.rows += len(values)
+
+        keys, checks = self._digests(values)
+        rows = np.arange(start, start + len(values), dtype=np.uint32)
+        result = keys.copy()
+
+        # Ordena o lote e descarta entradas repetidas (mesma chave e verificador)
+        order = np.lexsort((rows, checks, keys))
+        keys, checks, rows = keys[order], checks[order], rows[order]
+        first = np.ones(len(keys), dtype=bool)
+        first[1:] = (keys[1:] != keys[:-1]) | (checks[1:] != checks[:-1])
+        keys, checks, rows = keys[first], checks[first], rows[first]
+
+        # Colisões dentro do lote (entradas distintas com a mesma chave)
+        for i in np.flatnonzero(keys[1:] == keys[:-1]):
+            pair = rows[i:i + 2]
+            self._collide(keys[i], pair, [values[row - start] for row in pair])
+
+        # Comparação com os runs anteriores (busca binária)
+        new = np.ones(len(keys), dtype=bool)
+        for run_keys, run_checks, run_rows in self._runs:
+            left = np.searchsorted(run_keys, keys, 'left')
+            right = np.searchsorted(run_keys, keys, 'right')
+            for i in np.flatnonzero(right > left):
+                span = slice(left[i], right[i])
+                same = run_checks[span] == checks[i]
+                if same.any():
+                    new[i] = False  # Entrada já vista: não é colisão
+                    continue
+                earlier = run_rows[span]
+                self._collide(keys[i], earlier, [None] * len(earlier))
+                self._collide(keys[i], rows[i:i + 1], [values[rows[i] - start]])
+
+        # Novo run; intercala enquanto o anterior não for bem maior
+        run = (keys[new], checks[new], rows[new])
+        while self._runs and len(self._runs[-1][0]) <= 2 * len(run[0]):
+            previous = self._runs.pop()
+            merged = [np.concatenate(pair) for pair in zip(previous, run)]
+            order = np.lexsort((merged[1], merged[0]))
+            run = tuple(array[order] for array in merged)
+        if len(run[0]):
+            self._runs.append(run)
+
+        return result
+
+    @property
+    def collision_rate(self) -> float:
+        """Fração das entradas distintas envolvidas em colisões."""
+        unique = len(self)
+        colliding = sum(len(entries) for entries in self.collisions.values())
+        return colliding / unique if unique else 0.0
+
+    @property
+    def expected_collisions(self) -> float:
+        """Pares em colisão esperados (paradoxo do aniversário) para len(self)."""
+        n = len(self)
+        return n * (n - 1) / 2 / 2**self.bits
+
+    def report(self, lookup = None) -> dict:
+        """
+        Resume a auditoria.
+
+        Args:
+            lookup: Função lookup(linha) -> entrada, usada para preencher as
+                entradas de linhas de lotes anteriores (opcional; em streams
+                elas não ficam em memória e aparecem como None)
+
+        Returns:
+            dict: rows, unique, colliding_keys, collision_rate,
+                expected_collisions e collisions ({chave: {linha: entrada}})
+        """
+        if lookup is not None:
+            for entries in self.collisions.values():
+                for row, value in entries.items():
+                    if value is None:
+                        entries[row] = lookup(row)
+        return {
+            'rows': self.rows,
+            'unique': len(self),
+            'colliding_keys': len(self.collisions),
+            'collision_rate': self.collision_rate,
+            'expected_collisions': self.expected_collisions,
+            'collisions': self.collisions,
+        }
+
+def audit_md5_keys(values, bits: int = 64, encoding = 'utf-8', batch_size: int = 1_000_000):
+    """
+    Gera as chaves md5 truncadas de uma coluna inteira auditando colisões.
+
+    Args:
+        values: Series, array ou lista de strings (acesso por posição)
+        bits: 64 (hash_md5_int64) ou 32 (hash_md5_int32)
+        encoding: Codificação das strings (padrão: 'utf-8')
+        batch_size: Linhas por lote (padrão: 1 milhão)
+
+    Returns:
+        tuple: (keys, report), com o array uint64/uint32 das chaves e o
+            relatório de KeyCollisionAuditor.report() com as entradas
+            de todas as colisões
+
+    Example:
+        >>> keys, report = audit_md5_keys(df['codigo'], bits=32)
+        >>> report['colliding_keys'], report['collision_rate']
+    """
+    import numpy as np  # pip install numpy
+    auditor = KeyCollisionAuditor(bits, encoding)
+    items = values.iloc if hasattr(values, 'iloc') else values
+    keys = [auditor.add(items[i:i + batch_size])
+            for i in range(0, len(values), batch_size)]
+    keys = np.concatenate(keys) if keys else np.empty(0, dtype=f'u{bits // 8}')
+    return keys, auditor.report(lookup=items.__getitem__)
+
+#%% BLAKE2b-64 em lote e em colunas
+def blake64_many(items):
+    """
+    Calcula BLAKE2b-64 de uma sequência de objetos bytes-like.
+
+    Returns:
+        numpy.ndarray: Array uint64 (mesmo valor de hash_blake64_int64)
+    """
+    import numpy as np  # pip install numpy
+    data = b''.join([blake2b(item, digest_size=8).digest() for item in items])
+    return np.frombuffer(data, dtype='>u8').astype(np.uint64)
+
+def _blake64_column(values, encoding):
+    return blake64_many([s.encode(encoding) for s in values])
+
+def hash_blake64_int64_column(values, encoding = 'utf-8', workers: int = 1):
+    """
+    Versão vetorizada de hash_blake64_int64 para uma coluna de strings.
+
+    Args:
+        values: Series, array ou lista de strings
+        encoding: Codificação das strings (padrão: 'utf-8')
+        workers: Processos para colunas muito grandes (padrão: 1 = sem pool)
+
+    Returns:
+        numpy.ndarray: Array uint64, na mesma ordem de values
+    """
+    return _map_column(_blake64_column, values, workers, encoding)
+
+#%% Memoização opcional (LRU limitado) das funções de hash de strings
+# Para fluxos em que poucas chaves se repetem milhões de vezes. Não altera
+# as funções do módulo: o cache é criado explicitamente e expõe versões
+# memoizadas delas (cache.md5_str, cache.hash_md5_int64...) ou de qualquer
+# função f(s, ...) via cache.memoize(f).
+MEMOIZABLE_FUNCTIONS = (
+    'crc_str', 'crc64_str', 'md5_str', 'hash_md5_int64', 'hash_md5_int32',
+    'sha160_str', 'sha1', 'sha256_str', 'sha2', 'sha512_str', 'sha3',
+    'hash_crc32', 'hash_crc64', 'hash_crc32_hex', 'hash_crc32_int32',
+    'hash_crc32_int16', 'hash_crc32_str', 'hash_crc64_hex', 'hash_crc64_int64',
+    'hash_crc64_str', 'hash_blake64', 'hash_blake64_hex', 'hash_blake64_int64',
+    'hash_blake64_str',
+)
+
+# Custo fixo estimado por entrada (nó do OrderedDict, tupla da chave, ponteiros)
+_CACHE_ENTRY_OVERHEAD = 160
+
+class HashCache:
+    """
+    Cache LRU limitado por quantidade de entradas e por memória estimada.
+
+    A chave é (função, argumentos extras, entrada): para md5_str(s, encoding)
+    equivale a (algoritmo, encoding, s). Os argumentos são normalizados pela
+    assinatura da função, de modo que md5_str(s), md5_str(s, 'utf-8') e
+    md5_str(s, encoding='utf-8') usam a mesma entrada. Seguro entre threads.
+
+    Args:
+        maxsize: Máximo de entradas (padrão: 65536)
+        max_bytes: Máximo de memória estimada das entradas (padrão: 32MB)
+
+    Example:
+        >>> cache = HashCache(maxsize=10000)
+        >>> df['key'] = df['cliente'].map(cache.hash_md5_int64)
+        >>> cache.info()['hit_rate']
+    """
+
+    def __init__(self, maxsize: int = 65536, max_bytes: int = 32 * 1024 * 1024):
+        if maxsize < 1 or max_bytes < 1:
+            raise ValueError("maxsize e max_bytes devem ser positivos")
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+        self._entries = OrderedDict()  # chave -> (resultado, bytes estimados)
+        self._wrappers = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getattr__(self, name):
+        """Versões memoizadas das funções de MEMOIZABLE_FUNCTIONS."""
+        if name not in MEMOIZABLE_FUNCTIONS:
+            raise AttributeError(name)
+        wrapper = self._wrappers.get(name)
+        if wrapper is None:
+            wrapper = self._wrappers[name] = self.memoize(globals()[name])
+        return wrapper
+
+    def memoize(self, func):
+        """
+        Retorna uma versão memoizada de func(s, ...) que usa este cache.
+
+        Os argumentos extras (encoding, out_format...), posicionais ou
+        nomeados, fazem parte da chave (com os valores padrão aplicados)
+        e precisam ser hashable.
+        """
+        name = func.__name__
+        signature = inspect.signature(func)
+
+        def memoized(s, *args, **kwargs):
+            bound = signature.bind(s, *args, **kwargs)
+            bound.apply_defaults()
+            key = (name, tuple(bound.arguments.values())[1:], s)
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+            result = func(*bound.args, **bound.kwargs)
+            self._store(key, result)
+            return result
+
+        memoized.__name__ = name
+        memoized.__doc__ = func.__doc__
+        return memoized
+
+    def _store(self, key, result):
+        size = (sys.getsizeof(key[2]) + sys.getsizeof(result)
+                + _CACHE_ENTRY_OVERHEAD)
+        with self._lock:
+            self.misses += 1
+            if key in self._entries or size > self.max_bytes:
+                return
+            self._entries[key] = (result, size)
+            self.nbytes += size
+            while len(self._entries) > self.maxsize or self.nbytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+                self.evictions += 1
+
+    def info(self) -> dict:
+        """Contadores: hits, misses, evictions, entries, bytes e hit_rate."""
+        with self._lock:
+            calls = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self.nbytes,
+                'hit_rate': self.hits / calls if calls else 0.0,
+            }
+
+    def clear(self, reset_stats: bool = False) -> None:
+        """Esvazia o cache (e zera os contadores, se reset_stats)."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+            if reset_stats:
+                self.hits = self.misses = self.evictions = 0
+
+#%% Finalizador do splitmix64 (mistura de inteiros de 64 bits)
+# Espalha os bits de uma chave de 64 bits (cada bit de entrada afeta todos
+# os de saída). Usado para combinar colunas (row_fingerprints), derivar
+# hashes do Bloom filter (mydedup) e pesos do rendezvous (mypartition).
+def splitmix64(z):
+    """
+    Aplica o finalizador do splitmix64 a um inteiro ou array uint64.
+
+    Args:
+        z: int (tratado como uint64) ou array NumPy uint64
+
+    Returns:
+        int ou numpy.ndarray uint64, conforme a entrada
+
+    Example:
+        >>> splitmix64(0), splitmix64(1) == 0x5692161D100B05E5
+        (0, True)
+    """
+    if isinstance(z, int):
+        mask = 0xFFFFFFFFFFFFFFFF
+        z &= mask
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & mask
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & mask
+        return z ^ (z >> 31)
+    import numpy as np  # pip install numpy
+    z = np.asarray(z, dtype=np.uint64)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+#%% Fingerprint de linhas de DataFrames (detecção de mudanças entre cargas)
+# Substitui concatenar as colunas em uma string e chamar md5_str por linha:
+# cada coluna vira um array uint64 (numéricas pelos bytes brutos, sem
+# formatação; textos pelo hash vetorizado) e as colunas são combinadas por
+# linha com o finalizador do splitmix64, tudo em operações NumPy.
+_ROW_STRING_HASHES = {
+    'crc64': hash_crc64_int64_column,
+    'md5': hash_md5_int64_column,
+    'blake64': hash_blake64_int64_column,
+}
+
+# Valor de um campo nulo em colunas de texto (distinto do hash de '' e 'None')
+_ROW_NULL = 0x6E756C6C6E756C6C
+
+def _numeric_column_uint64(values):
+    """Bytes brutos de uma coluna numérica/datetime como um uint64 por linha."""
+    import numpy as np  # pip install numpy
+    if values.dtype.kind in 'fc':
+        values = np.where(np.isnan(values), np.nan, values)  # NaN canônico
+    values = np.ascontiguousarray(values)
+    size = values.dtype.itemsize
+    if size < 8:
+        return values.view(f'u{size}').astype(np.uint64)
+    words = values.view(np.uint64).reshape(len(values), size // 8)
+    h = words[:, 0].copy()
+    for i in range(1, words.shape[1]):
+        h = splitmix64(h) ^ words[:, i]
+    return h
+
+def row_fingerprints(df, columns=None, algorithm: str = 'crc64', encoding = 'utf-8'):
+    """
+    Calcula um hash de 64 bits por linha de um DataFrame.
+
+    Colunas numéricas, booleanas e datetime entram pelos bytes brutos (1 e
+    1.0 diferem; todo NaN é igual). As demais são convertidas com str() e
+    passam pelo hash vetorizado de textos; nulos têm um valor próprio.
+    A ordem das colunas faz parte do fingerprint.
+
+    Args:
+        df: pandas.DataFrame
+        columns: Colunas consideradas, nesta ordem (padrão: todas)
+        algorithm: Hash das colunas de texto: 'crc64' (padrão), 'md5' ou 'blake64'
+        encoding: Codificação das strings (padrão: 'utf-8')
+
+    Returns:
+        numpy.ndarray: Array uint64 com o fingerprint de cada linha
+
+    Example:
+        >>> df['fp'] = row_fingerprints(df, ['nome', 'valor', 'data'])
+    """
+    import numpy as np  # pip install numpy
+    import pandas as pd  # pip install pandas
+    if algorithm not in _ROW_STRING_HASHES:
+        raise ValueError(f"Algoritmo '{algorithm}' não suportado. "
+                         f"Use: {', '.join(_ROW_STRING_HASHES)}")
+    columns = list(df.columns) if columns is None else list(columns)
+
+    h = np.full(len(df), len(columns), dtype=np.uint64)
+    for column in columns:
+        series = df[column]
+        values = series.to_numpy()
+        if values.dtype.kind in 'biufcmM':
+            col = _numeric_column_uint64(values)
+        else:
+            nulls = pd.isna(series).to_numpy()
+            texts = [str(v) for v in values[~nulls]]
+            col = np.full(len(values), _ROW_NULL, dtype=np.uint64)
+            col[~nulls] = _ROW_STRING_HASHES[algorithm](texts, encoding)
+        h = splitmix64((h * np.uint64(0x9E3779B97F4A7C15)) ^ col)
+    return h
+
+def diff_row_fingerprints(old_keys, old_fingerprints, new_keys, new_fingerprints) -> dict:
+    """
+    Compara duas cargas pelos fingerprints, casando as linhas pela chave.
+
+    Args:
+        old_keys: Chaves primárias da carga anterior (Index, Series ou array)
+        old_fingerprints: Fingerprints da carga anterior (row_fingerprints)
+        new_keys: Chaves primárias da carga nova
+        new_fingerprints: Fingerprints da carga nova
+
+    Returns:
+        dict: {'inserted', 'updated', 'deleted'} com arrays das chaves
+
+    Raises:
+        ValueError: Se houver chaves repetidas em uma das cargas
+
+    Example:
+        >>> old = pd.read_parquet("ontem.parquet")
+        >>> new = pd.read_parquet("hoje.parquet")
+        >>> diff = diff_row_fingerprints(old['id'], row_fingerprints(old),
+        ...                              new['id'], row_fingerprints(new))
+        >>> new[new['id'].isin(diff['updated'])]
+    """
+    import numpy as np  # pip install numpy
+    import pandas as pd  # pip install pandas
+    old = pd.Series(np.asarray(old_fingerprints, dtype=np.uint64),
+                    index=pd.Index(old_keys))
+    new = pd.Series(np.asarray(new_fingerprints, dtype=np.uint64),
+                    index=pd.Index(new_keys))
+    if not old.index.is_unique or not new.index.is_unique:
+        raise ValueError("As chaves de cada carga devem ser únicas")
+
+    common = new.index.intersection(old.index)
+    changed = old.loc[common].to_numpy() != new.loc[common].to_numpy()
+    return {
+        'inserted': new.index.difference(old.index).to_numpy(),
+        'updated': common[changed].to_numpy(),
+        'deleted': old.index.difference(new.index).to_numpy(),
+    }
+
+#%% Funções SQLite (hash dentro de SELECT/GROUP BY, sem tirar os dados do banco)
+# Cada função: (algoritmo de HASH_ALGORITHMS, conversão do hasher no resultado).
+# O SQLite só guarda inteiros com sinal de 64 bits: crc64 e md5_int64 saem
+# como int64 com os mesmos 64 bits de hash_crc64_int64/hash_md5_int64
+# (valor & 0xFFFFFFFFFFFFFFFF em Python; printf('%016x', ...) no SQL).
+def _signed64(value):
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+SQLITE_FUNCTIONS = {
+    'crc32': ('crc32', lambda h: h.intdigest()),                   # hash_crc32_int32
+    'crc64': ('crc64', lambda h: _signed64(h.intdigest())),        # hash_crc64_int64
+    'md5': ('md5', lambda h: h.hexdigest()),                       # md5_str
+    'md5_int64': ('md5', lambda h: int.from_bytes(h.digest()[:8], 'big', signed=True)),
+    'md5_int32': ('md5', lambda h: int.from_bytes(h.digest()[:4], 'big')),
+    'sha1': ('sha1', lambda h: h.hexdigest()),                     # sha160_str
+    'sha256': ('sha256', lambda h: h.hexdigest()),                 # sha256_str
+    'sha512': ('sha512', lambda h: h.hexdigest()),                 # sha512_str
+}
+
+def _sqlite_bytes(value, encoding):
+    """Valor SQLite em bytes: BLOB como está, TEXT codificado, números como texto."""
+    if isinstance(value, bytes):
+        return value
+    if not isinstance(value, str):
+        value = str(value)
+    return value.encode(encoding)
+
+def _sqlite_scalar(algorithm, result, encoding):
+    def func(value):
+        if value is None:
+            return None
+        return result(new_hasher(algorithm, _sqlite_bytes(value, encoding)))
+    return func
+
+def _sqlite_aggregate(algorithm, result, encoding):
+    class Aggregate:
+        """Hash da concatenação dos valores do grupo (NULLs ignorados)."""
+        def __init__(self):
+            self.hasher = None
+
+        def step(self, value):
+            if value is None:
+                return
+            if self.hasher is None:
+                self.hasher = new_hasher(algorithm)
+            self.hasher.update(_sqlite_bytes(value, encoding))
+
+        def finalize(self):
+            return None if self.hasher is None else result(self.hasher)
+    return Aggregate
+
+def register_sqlite_functions(conn, prefix: str = '', encoding = 'utf-8'):
+    """
+    Registra as funções de SQLITE_FUNCTIONS em uma conexão sqlite3.
+
+    Para cada nome são criadas a função escalar (determinística, utilizável
+    em índices e colunas geradas) e a agregada <nome>_agg, que calcula o
+    hash da concatenação dos valores do grupo, na ordem em que chegam: use
+    md5_agg(x ORDER BY y) (SQLite 3.44+) ou uma subconsulta ordenada para
+    um resultado estável. Os resultados são idênticos aos das funções
+    Python sobre a mesma string; NULL resulta em NULL.
+
+    Args:
+        conn: Conexão sqlite3
+        prefix: Prefixo dos nomes no SQL (ex: 'my_' -> my_md5)
+        encoding: Codificação dos valores TEXT (padrão: 'utf-8')
+
+    Returns:
+        list: Nomes registrados
+
+    Example:
+        >>> import sqlite3
+        >>> conn = sqlite3.connect(":memory:")
+        >>> names = register_sqlite_functions(conn)
+        >>> conn.execute("SELECT md5('123456')").fetchone()[0] == md5_str("123456")
+        True
+        >>> conn.execute("SELECT md5_int32('123456')").fetchone()[0] == hash_md5_int32("123456")
+        True
+    """
+    names = []
+    for name, (algorithm, result) in SQLITE_FUNCTIONS.items():
+        conn.create_function(prefix + name, 1,
+                             _sqlite_scalar(algorithm, result, encoding),
+                             deterministic=True)
+        conn.create_aggregate(prefix + name + '_agg', 1,
+                              _sqlite_aggregate(algorithm, result, encoding))
+        names += [prefix + name, prefix + name + '_agg']
+    return names
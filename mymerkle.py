@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+Fingerprint de diretórios com árvore de Merkle.
+
+Cada arquivo é uma folha com seu hash (CRC-64, SHA-256 ou qualquer
+algoritmo de myhash.HASH_ALGORITHMS) e cada diretório tem o hash dos
+nomes e hashes de seus filhos. O hash da raiz muda se, e somente se,
+algum arquivo incluído mudar, for criado, renomeado ou removido.
+
+A árvore da execução anterior é salva em JSON. Na execução seguinte,
+arquivos com o mesmo (size, mtime_ns) reaproveitam o hash anterior sem
+serem relidos, e diretórios cujos filhos não mudaram mantêm o hash:
+apenas os ramos alterados são recalculados.
+
+Created on Sun Oct 18 2026
+@author: uendelrocha@gmail.com
+
+Example:
+    >>> from my.mymerkle import dir_fingerprint
+    >>> root, changed = dir_fingerprint("saida/", "saida.merkle.json")
+    >>> if changed:
+    ...     print(f"{len(changed)} itens alterados: {changed[:5]}")
+"""
+
+import json
+import os
+
+from my import myexplorer, myhash, myuseful
+
+# =============================================================================
+# FUNÇÕES INTERNAS
+# =============================================================================
+
+def _dir_digest(node, algorithm):
+    """Calcula o hash de um diretório a partir dos nomes e hashes dos filhos."""
+    hasher = myhash.new_hasher(algorithm)
+    for name in sorted(node['dirs']):
+        entry = f"d\0{name}\0{node['dirs'][name]['hash']}\n"
+        hasher.update(entry.encode('utf-8', 'surrogateescape'))
+    for name in sorted(node['files']):
+        entry = f"f\0{name}\0{node['files'][name][0]}\n"
+        hasher.update(entry.encode('utf-8', 'surrogateescape'))
+    return hasher.hexdigest()
+
+
+def _empty_node():
+    return {'hash': None, 'dirs': {}, 'files': {}}
+
+
+def _build(dirpath, previous, algorithm, prefix, extension, relpath, changed):
+    """
+    Monta (recursivamente) o nó de um diretório, reaproveitando o anterior.
+
+    Args:
+        dirpath (str): Caminho do diretório
+        previous (dict): Nó do mesmo diretório na árvore anterior (ou vazio)
+        algorithm (str): Algoritmo de hash
+        prefix (str): Prefixo dos arquivos (opcional)
+        extension (list): Extensões dos arquivos (filtro de dir_files)
+        relpath (str): Caminho relativo à raiz, terminado em '/' (ou '')
+        changed (list): Recebe os caminhos relativos alterados
+
+    Returns:
+        dict: Nó {'hash', 'dirs', 'files'}; files[nome] = [hash, size, mtime_ns]
+    """
+    node = _empty_node()
+
+    # Arquivos: extensões filtradas por myexplorer.dir_files (espera path
+    # terminado em /). O prefixo é filtrado aqui: com prefixo, dir_files
+    # ordena por tamanho e descarta arquivos vazios, que também são folhas
+    files, _ = myexplorer.dir_files(None, extension, os.path.join(dirpath, ''))
+    if prefix:
+        files = [name for name in files if name.startswith(prefix)]
+    for name in files:
+        filepath = os.path.join(dirpath, name)
+        st = os.stat(filepath)
+        old = previous['files'].get(name)
+
+        if old and old[1] == st.st_size and old[2] == st.st_mtime_ns:
+            node['files'][name] = old
+            continue
+
+        node['files'][name] = [myhash.hexdigest_file(filepath, algorithm),
+                               st.st_size, st.st_mtime_ns]
+        if not old or old[0] != node['files'][name][0]:
+            changed.append(relpath + name)
+
+    changed.extend(relpath + name
+                   for name in previous['files'].keys() - node['files'].keys())
+
+    # Subdiretórios (links simbólicos não são seguidos)
+    with os.scandir(dirpath) as entries:
+        subdirs = [entry.name for entry in entries
+                   if entry.is_dir(follow_symlinks=False)]
+    for name in subdirs:
+        node['dirs'][name] = _build(os.path.join(dirpath, name),
+                                    previous['dirs'].get(name, _empty_node()),
+                                    algorithm, prefix, extension,
+                                    f"{relpath}{name}/", changed)
+
+    changed.extend(f"{relpath}{name}/"
+                   for name in previous['dirs'].keys() - node['dirs'].keys())
+
+    # Ramo limpo: mesmos filhos com os mesmos hashes mantêm o hash anterior
+    same_children = (
+        previous['hash'] is not None
+        and node['files'].keys() == previous['files'].keys()
+        and node['dirs'].keys() == previous['dirs'].keys()
+        and all(node['files'][name][0] == previous['files'][name][0]
+                for name in node['files'])
+        and all(node['dirs'][name]['hash'] == previous['dirs'][name]['hash']
+                for name in node['dirs'])
+    )
+    if same_children:
+        node['hash'] = previous['hash']
+    else:
+        node['hash'] = _dir_digest(node, algorithm)
+        if relpath:
+            changed.append(relpath)
+
+    return node
+
+
+# =============================================================================
+# API PÚBLICA
+# =============================================================================
+
+def merkle_tree(path: str, previous: dict = None, algorithm: str = 'crc64',
+                prefix: str = None, extension=None):
+    """
+    Monta a árvore de Merkle de um diretório e lista o que mudou.
+
+    Args:
+        path (str): Diretório raiz
+        previous (dict): Árvore de uma execução anterior (opcional). Se for
+            de outro algoritmo ou de outros filtros (prefix/extension), é
+            ignorada e tudo é recalculado.
+        algorithm (str): Algoritmo das folhas e nós (chave de
+            myhash.HASH_ALGORITHMS; padrão: 'crc64')
+        prefix (str): Considera apenas arquivos com este prefixo (opcional)
+        extension (str | list): Considera apenas estas extensões (opcional)
+
+    Returns:
+        tuple: (tree, changed), onde tree é a nova árvore (serializável em
+            JSON) e changed é a lista ordenada de caminhos relativos
+            criados, alterados ou removidos (diretórios terminam em '/')
+
+    Raises:
+        FileNotFoundError: Se o diretório não existir
+        ValueError: Se o algoritmo não estiver registrado em myhash
+    """
+    myhash.new_hasher(algorithm)  # Valida o algoritmo antes de percorrer
+
+    same_setup = (previous
+                  and previous.get('algorithm') == algorithm
+                  and previous.get('prefix') == prefix
+                  and previous.get('extension') == extension)
+    if same_setup:
+        previous_root = previous['root']
+    else:
+        previous_root = _empty_node()
+
+    changed = []
+    root = _build(path, previous_root, algorithm, prefix, extension or [], '',
+                  changed)
+    tree = {'algorithm': algorithm, 'prefix': prefix, 'extension': extension,
+            'root': root}
+    return tree, sorted(changed)
+
+
+def load_tree(tree_path: str):
+    """Carrega uma árvore salva por save_tree (None se o arquivo não existir)."""
+    if not os.path.isfile(tree_path):
+        return None
+    with open(tree_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_tree(tree: dict, tree_path: str) -> None:
+    """Salva a árvore em JSON (myuseful.atomic_write)."""
+    with myuseful.atomic_write(tree_path, 'w', encoding='utf-8') as f:
+        json.dump(tree, f, ensure_ascii=False, separators=(',', ':'))
+
+
+def dir_fingerprint(path: str, tree_path: str = None, algorithm: str = 'crc64',
+                    prefix: str = None, extension=None):
+    """
+    Calcula o fingerprint (hash da raiz de Merkle) de um diretório.
+
+    Com tree_path, a árvore anterior é carregada para recalcular apenas os
+    ramos alterados, e a nova árvore é salva para a próxima execução.
+
+    Args:
+        path (str): Diretório raiz
+        tree_path (str): Arquivo JSON da árvore persistida (opcional)
+        algorithm (str): 'crc64' (padrão), 'sha256' ou outro de myhash
+        prefix (str): Considera apenas arquivos com este prefixo (opcional)
+        extension (str | list): Considera apenas estas extensões (opcional)
+
+    Returns:
+        tuple: (root_hash, changed) com o hash hexadecimal da raiz e a
+            lista de caminhos relativos alterados desde a árvore anterior
+
+    Example:
+        >>> root, changed = dir_fingerprint("dados/", "dados.merkle.json",
+        ...                                 extension='parquet')
+    """
+    previous = load_tree(tree_path) if tree_path else None
+    tree, changed = merkle_tree(path, previous, algorithm, prefix, extension)
+    if tree_path:
+        save_tree(tree, tree_path)
+    return tree['root']['hash'], changed
+
+
+__all__ = [
+    'merkle_tree',
+    'load_tree',
+    'save_tree',
+    'dir_fingerprint',
+]
@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+"""
+Particionamento consistente de chaves (sharding) sobre os hashes de myhash.
+
+Particionar com hash_md5_int32(chave) % n muda o bucket de quase todas as
+chaves quando n muda (de 10 para 11 buckets, ~91% das chaves mudam), o que
+obriga a recalcular tudo. Aqui há duas alternativas consistentes:
+
+    - jump: Jump Consistent Hash (Lamping & Veach, 2014). Sem memória extra
+      e O(ln n) por chave; ao passar de n para m buckets só |m - n| / max(n, m)
+      das chaves mudam. Os buckets são 0..n-1 e só se remove o último.
+    - rendezvous: Highest Random Weight. Cada chave vai para o bucket de
+      maior peso mix(hash(chave) ^ seed(bucket)). O(n) por chave, mas os
+      buckets podem ter nomes e qualquer um pode ser removido: só as chaves
+      que estavam nele mudam.
+
+As chaves são convertidas em inteiros de 64 bits por hash_md5_int64 (padrão),
+hash_crc64_int64 ou hash_blake64_int64. As variantes *_column usam as versões
+vetorizadas de myhash e calculam os buckets com NumPy, sem laço por linha.
+
+Created on Sun Oct 18 2026
+@author: uendelrocha@gmail.com
+
+Example:
+    >>> from my.mypartition import partition, partition_column, moved_keys
+    >>> partition("cliente-42", 16)
+    >>> df['shard'] = partition_column(df['cliente'], 16)
+    >>> moved_keys(df['cliente'], 16, 17)['moved_fraction']  # ~ 1/17
+"""
+
+from my import mycrc, myhash
+
+# =============================================================================
+# CONSTANTES
+# =============================================================================
+
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+# Multiplicador do gerador congruente linear do Jump Consistent Hash
+_JUMP_MULTIPLIER = 2862933555777941757
+
+# Hash da chave para inteiro de 64 bits: (função escalar, função de coluna).
+# As escalares recebem (s, encoding) e dão o mesmo valor de hash_md5_int64,
+# hash_crc64_int64 e hash_blake64_int64 (em utf-8).
+KEY_HASHES = {
+    'md5': (myhash.hash_md5_int64, myhash.hash_md5_int64_column),
+    'crc64': (lambda s, encoding='utf-8': mycrc.crc64(s.encode(encoding)),
+              myhash.hash_crc64_int64_column),
+    'blake64': (myhash.hash_blake64_int64, myhash.hash_blake64_int64_column),
+}
+
+METHODS = ('jump', 'rendezvous')
+
+# Memória da matriz (chaves x buckets) uint64 de cada bloco do rendezvous
+# vetorizado; os temporários do splitmix64 somam mais ~3x
+_RENDEZVOUS_BLOCK_BYTES = 32 * 1024 * 1024
+
+
+# =============================================================================
+# FUNÇÕES INTERNAS
+# =============================================================================
+
+def _key_hash(algorithm):
+    try:
+        return KEY_HASHES[algorithm]
+    except KeyError:
+        raise ValueError(f"Algoritmo '{algorithm}' não suportado. "
+                         f"Use: {', '.join(KEY_HASHES)}") from None
+
+
+def _check_method(method):
+    if method not in METHODS:
+        raise ValueError(f"Método '{method}' não suportado. "
+                         f"Use: {', '.join(METHODS)}")
+
+
+def _bucket_count(buckets, method='rendezvous'):
+    """
+    Valida os buckets e retorna a quantidade.
+
+    Raises:
+        ValueError: Se não houver buckets ou se o jump receber nomes
+    """
+    if method == 'jump' and not isinstance(buckets, int):
+        raise ValueError("O método 'jump' aceita apenas a quantidade de buckets")
+    n = buckets if isinstance(buckets, int) else len(buckets)
+    if n < 1:
+        raise ValueError("É necessário ao menos um bucket")
+    return n
+
+
+def _bucket_seeds(buckets, algorithm):
+    """
+    Sementes dos buckets do rendezvous: um inteiro de 64 bits por bucket.
+
+    Buckets numerados (int) usam splitmix64(índice); buckets nomeados usam o
+    hash do nome, de modo que a semente não depende da posição na lista.
+    """
+    if isinstance(buckets, int):
+        return [myhash.splitmix64(i) for i in range(buckets)]
+    scalar, _ = _key_hash(algorithm)
+    return [scalar(str(name)) for name in buckets]
+
+
+def _rendezvous_column(hashes, seeds):
+    import numpy as np  # pip install numpy
+    seeds = np.asarray(seeds, dtype=np.uint64)
+    result = np.empty(len(hashes), dtype=np.int32)
+    rows = max(1, _RENDEZVOUS_BLOCK_BYTES // (8 * len(seeds)))
+    for start in range(0, len(hashes), rows):
+        block = hashes[start:start + rows, None]
+        result[start:start + rows] = np.argmax(
+            myhash.splitmix64(block ^ seeds), axis=1)
+    return result
+
+
+# =============================================================================
+# API PÚBLICA
+# =============================================================================
+
+def jump_hash(key: int, buckets: int) -> int:
+    """
+    Jump Consistent Hash de um inteiro de 64 bits.
+
+    Args:
+        key (int): Chave (uint64, ex: hash_md5_int64(texto))
+        buckets (int): Quantidade de buckets
+
+    Returns:
+        int: Bucket em [0, buckets)
+
+    Example:
+        >>> jump_hash(0, 1)
+        0
+        >>> all(jump_hash(k, 11) in (jump_hash(k, 10), 10) for k in range(1000))
+        True
+    """
+    _bucket_count(buckets, 'jump')
+    key &= _MASK64
+    b, j = -1, 0
+    while j < buckets:
+        b = j
+        key = (key * _JUMP_MULTIPLIER + 1) & _MASK64
+        j = int((b + 1) * (float(1 << 31) / float((key >> 33) + 1)))
+    return b
+
+
+def jump_hash_column(keys, buckets: int):
+    """
+    Versão vetorizada de jump_hash: todas as chaves avançam juntas, e as que
+    já terminaram saem da iteração (O(ln buckets) passos sobre o array).
+
+    Args:
+        keys: Array (ou lista) de inteiros uint64
+        buckets (int): Quantidade de buckets
+
+    Returns:
+        numpy.ndarray: Array int32 com o bucket de cada chave, mesmo
+            resultado de jump_hash
+    """
+    import numpy as np  # pip install numpy
+    _bucket_count(buckets, 'jump')
+    keys = np.array(keys, dtype=np.uint64)
+    result = np.zeros(len(keys), dtype=np.int64)
+    j = np.zeros(len(keys), dtype=np.int64)
+    active = np.arange(len(keys))
+    while len(active):
+        b = j[active]
+        result[active] = b
+        key = keys[active] * np.uint64(_JUMP_MULTIPLIER) + np.uint64(1)
+        keys[active] = key
+        scale = float(1 << 31) / ((key >> np.uint64(33)) + np.uint64(1)).astype(np.float64)
+        j[active] = ((b + 1) * scale).astype(np.int64)
+        active = active[j[active] < buckets]
+    return result.astype(np.int32)
+
+
+def rendezvous_hash(key: int, buckets, algorithm: str = 'md5') -> int:
+    """
+    Rendezvous (Highest Random Weight) de um inteiro de 64 bits.
+
+    Args:
+        key (int): Chave (uint64, ex: hash_md5_int64(texto))
+        buckets (int | list): Quantidade de buckets ou lista de nomes
+        algorithm (str): Hash dos nomes dos buckets (padrão: 'md5')
+
+    Returns:
+        int: Índice do bucket escolhido (em range(buckets) ou na lista)
+    """
+    _bucket_count(buckets)
+    key &= _MASK64
+    seeds = _bucket_seeds(buckets, algorithm)
+    return max(range(len(seeds)), key=lambda i: myhash.splitmix64(key ^ seeds[i]))
+
+
+def partition(key: str, buckets, method: str = 'jump', algorithm: str = 'md5',
+              encoding='utf-8') -> int:
+    """
+    Bucket consistente de uma chave texto.
+
+    Args:
+        key (str): Chave
+        buckets (int | list): Quantidade de buckets (ou nomes, no rendezvous)
+        method (str): 'jump' (padrão) ou 'rendezvous'
+        algorithm (str): Hash da chave: 'md5' (padrão), 'crc64' ou 'blake64'
+        encoding (str): Codificação da chave (padrão: 'utf-8')
+
+    Returns:
+        int: Índice do bucket
+
+    Raises:
+        ValueError: Se método ou algoritmo não forem suportados, ou se o
+            jump receber nomes de buckets
+    """
+    _check_method(method)
+    _bucket_count(buckets, method)
+    scalar, _ = _key_hash(algorithm)
+    h = scalar(key, encoding)
+    if method == 'jump':
+        return jump_hash(h, buckets)
+    return rendezvous_hash(h, buckets, algorithm)
+
+
+def partition_column(values, buckets, method: str = 'jump', algorithm: str = 'md5',
+                     encoding='utf-8', workers: int = 1):
+    """
+    Versão vetorizada de partition para uma coluna de strings.
+
+    Args:
+        values: Series, array ou lista de strings
+        buckets (int | list): Quantidade de buckets (ou nomes, no rendezvous)
+        method (str): 'jump' (padrão) ou 'rendezvous'
+        algorithm (str): 'md5' (padrão), 'crc64' ou 'blake64'
+        encoding (str): Codificação das strings (padrão: 'utf-8')
+        workers (int): Processos para o hash da coluna (padrão: 1 = sem pool)
+
+    Returns:
+        numpy.ndarray: Array int32 com o índice do bucket de cada valor
+
+    Example:
+        >>> df['shard'] = partition_column(df['cliente'], 32)
+        >>> nodes = ['node-a', 'node-b', 'node-c']
+        >>> df['node'] = np.asarray(nodes)[partition_column(df['cliente'], nodes,
+        ...                                                 'rendezvous')]
+    """
+    _check_method(method)
+    _bucket_count(buckets, method)
+    _, column = _key_hash(algorithm)
+    hashes = column(values, encoding, workers)
+    if method == 'jump':
+        return jump_hash_column(hashes, buckets)
+    return _rendezvous_column(hashes, _bucket_seeds(buckets, algorithm))
+
+
+def moved_keys(values, old_buckets, new_buckets, method: str = 'jump',
+               algorithm: str = 'md5', encoding='utf-8', workers: int = 1) -> dict:
+    """
+    Mede quantas chaves mudam de bucket quando os buckets mudam.
+
+    Para buckets numerados, compara também com o particionamento por módulo
+    (hash % n) sobre os mesmos hashes.
+
+    Args:
+        values: Series, array ou lista de strings (amostra das chaves)
+        old_buckets (int | list): Buckets atuais
+        new_buckets (int | list): Buckets novos
+        method, algorithm, encoding, workers: Veja partition_column
+
+    Returns:
+        dict: keys (total), moved, moved_fraction, expected_fraction (mínimo
+            teórico, só para buckets numerados) e modulo_moved_fraction
+
+    Example:
+        >>> report = moved_keys(chaves, 10, 11)
+        >>> report['moved_fraction'], report['modulo_moved_fraction']
+        (0.0909..., 0.909...)
+    """
+    import numpy as np  # pip install numpy
+    _check_method(method)
+    _bucket_count(old_buckets, method)
+    _bucket_count(new_buckets, method)
+    _, column = _key_hash(algorithm)
+    hashes = column(values, encoding, workers)
+
+    def assign(buckets):
+        if method == 'jump':
+            return jump_hash_column(hashes, buckets)
+        index = _rendezvous_column(hashes, _bucket_seeds(buckets, algorithm))
+        # Rendezvous com nomes: compara nomes, não posições na lista
+        return index if isinstance(buckets, int) else np.asarray(buckets, dtype=object)[index]
+
+    moved = int(np.count_nonzero(assign(old_buckets) != assign(new_buckets)))
+    n = len(hashes)
+    report = {
+        'keys': n,
+        'moved': moved,
+        'moved_fraction': moved / n if n else 0.0,
+        'expected_fraction': None,
+        'modulo_moved_fraction': None,
+    }
+    if isinstance(old_buckets, int) and isinstance(new_buckets, int):
+        report['expected_fraction'] = (abs(new_buckets - old_buckets)
+                                       / max(old_buckets, new_buckets))
+        modulo_moved = np.count_nonzero(hashes % np.uint64(old_buckets)
+                                        != hashes % np.uint64(new_buckets))
+        report['modulo_moved_fraction'] = int(modulo_moved) / n if n else 0.0
+    return report
+
+
+__all__ = [
+    'KEY_HASHES',
+    'METHODS',
+    'jump_hash',
+    'jump_hash_column',
+    'rendezvous_hash',
+    'partition',
+    'partition_column',
+    'moved_keys',
+]
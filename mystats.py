@@ -223,4 +223,89 @@ def doanes_rule(df: pd.DataFrame, column_name: str) -> int:
         k = k_base_sturges
         # print(f"Aviso (Doane's Rule): sigma_g1 <= 0 para '{column_name}'. Usando apenas a parte de Sturges.")
 
-    return int(ceil(k))
\ No newline at end of file
+    return int(ceil(k))
+
+
+def column_summary(df: pd.DataFrame, column_name: str) -> dict:
+    """
+    Resumo de uma coluna numérica usado pelas regras de faixas.
+
+    Lê a coluna uma única vez para um array float64 e calcula n, min, max,
+    média, desvio padrão amostral (ddof=1), Q1/Q3 (interpolação linear,
+    como Series.quantile) e a assimetria ajustada (como skew(bias=False))
+    a partir dos mesmos desvios. Colunas constantes são detectadas por
+    min == max, sem nunique().
+    """
+    values = df[column_name].to_numpy(dtype=np.float64, na_value=np.nan)
+    values = values[~np.isnan(values)]
+    n = len(values)
+
+    if n == 0:
+        raise ValueError(f"A coluna '{column_name}' está vazia ou contém apenas NaNs.")
+
+    vmin, vmax = values.min(), values.max()
+    summary = {'n': n, 'min': vmin, 'max': vmax, 'mean': vmin, 'std': 0.0,
+               'q1': vmin, 'q3': vmin, 'skew': 0.0, 'constant': vmin == vmax}
+    if summary['constant'] or n == 1:
+        return summary
+
+    mean = values.mean()
+    deviations = values - mean
+    squares = deviations * deviations
+    m2 = squares.mean()
+    m3 = (squares * deviations).mean()
+    q1, q3 = np.quantile(values, [0.25, 0.75])
+
+    summary.update(mean=mean, std=np.sqrt(m2 * n / (n - 1)), q1=q1, q3=q3)
+    if n > 2 and m2 > 0:
+        summary['skew'] = np.sqrt(n * (n - 1)) / (n - 2) * m3 / m2**1.5
+    return summary
+
+
+def histogram_bins(df: pd.DataFrame, column_name: str) -> dict:
+    """
+    Calcula o número de faixas (k) por todas as regras de uma vez.
+
+    Equivale a chamar sturges_rule, sqrt_choice_rule, scotts_rule,
+    freedman_diaconis_rule, rice_rule e doanes_rule, mas a partir de um
+    único column_summary (a coluna é lida uma vez, não uma por regra).
+
+    Retorna: {'sturges', 'sqrt', 'scott', 'freedman_diaconis', 'rice', 'doane'}
+    """
+    s = column_summary(df, column_name)
+    n = s['n']
+
+    if s['constant'] or n == 1:
+        return dict.fromkeys(['sturges', 'sqrt', 'scott', 'freedman_diaconis',
+                              'rice', 'doane'], 1)
+
+    sturges = int(ceil(1 + np.log2(n)))
+    data_range = s['max'] - s['min']
+
+    # Scott: h = 3.49 * s / n^(1/3)
+    h = (3.49 * s['std']) / (n**(1/3))
+    scott = int(ceil(data_range / h)) if h > 0 else n
+
+    # Freedman-Diaconis: h = 2 * IQR / n^(1/3) (IQR zero: Sturges)
+    iqr = s['q3'] - s['q1']
+    h = (2 * iqr) / (n**(1/3))
+    if iqr == 0:
+        freedman_diaconis = sturges
+    else:
+        freedman_diaconis = int(ceil(data_range / h)) if h > 0 else n
+
+    # Doane: Sturges + log2(1 + |g1| / sigma_g1), apenas Sturges para n < 3
+    if n < 3:
+        doane = sturges
+    else:
+        sigma_g1 = np.sqrt((6 * (n - 2)) / ((n + 1) * (n + 3)))
+        doane = int(ceil(1 + np.log2(n) + np.log2(1 + np.abs(s['skew']) / sigma_g1)))
+
+    return {
+        'sturges': sturges,
+        'sqrt': int(ceil(np.sqrt(n))),
+        'scott': scott,
+        'freedman_diaconis': freedman_diaconis,
+        'rice': int(ceil(2 * (n**(1/3)))),
+        'doane': doane,
+    }
@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import os
+from contextlib import contextmanager
 
 def exists(obj_name:str):
   '''
@@ -24,4 +26,41 @@ def exists(obj_name:str):
   elif obj_name in globals():
     return True
   
-  return False
\ No newline at end of file
+  return False
+
+
+@contextmanager
+def atomic_write(path:str, mode:str = 'wb', **kwargs):
+  '''
+  Grava um arquivo de forma atômica: o conteúdo vai para um arquivo
+  temporário no mesmo diretório, que substitui path (os.replace) apenas
+  se o bloco terminar sem erro. Leitores nunca veem um arquivo parcial.
+
+  Parameters
+  ----------
+  path : str
+    Caminho do arquivo de destino.
+  mode : str
+    Modo de abertura do temporário ('wb' ou 'w').
+  **kwargs
+    Repassados a open() (ex: encoding='utf-8').
+
+  Yields
+  ------
+  file
+    Arquivo temporário aberto para escrita.
+
+  Example
+  -------
+  >>> with atomic_write("dados.json", 'w', encoding='utf-8') as f:
+  ...   json.dump(dados, f)
+  '''
+  tmp_path = f"{path}.{os.getpid()}.tmp"
+  try:
+    with open(tmp_path, mode, **kwargs) as f:
+      yield f
+    os.replace(tmp_path, path)
+  except BaseException:
+    if os.path.exists(tmp_path):
+      os.remove(tmp_path)
+    raise